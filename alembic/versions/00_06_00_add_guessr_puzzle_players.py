@@ -0,0 +1,74 @@
+"""add_guessr_puzzle_players
+
+Revision ID: 00_06_00
+Revises: 00_05_00
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from functools import lru_cache
+from typing import Sequence, Union
+import json
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00_06_00'
+down_revision: Union[str, None] = '00_05_00'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def _dao_config(puzzle_type: str, answer: int, config: dict) -> tuple[str, int, str, str]:
+    """Frozen copy of GuessrService._dao_config, so this revision does not depend on the live service."""
+    key = config.get("stat") or config.get("award") or config.get("position")
+    return (puzzle_type, answer, config["league"], key)
+
+
+@lru_cache
+def _baseball_dao():
+    """
+    The only use of the live DAO in this revision, imported on first use: a
+    fresh database has no puzzles to backfill and never loads it.
+    """
+    from src.dao.baseball_csv_dao import BaseballCSVDAO
+
+    return BaseballCSVDAO()
+
+
+def _render_players(configs: list[tuple[str, int, str, str]]) -> list[list[dict]]:
+    """Player lists of existing puzzles, read from the bundled CSVs."""
+    return _baseball_dao().get_players_for_configs(configs)
+
+
+def upgrade() -> None:
+    """
+    Store each puzzle's rendered player list, so reads no longer need the CSV engine.
+    Existing puzzles are backfilled from the CSVs in batches.
+    """
+    op.add_column('guessr_puzzle', sa.Column('players', JSONB(), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, puzzle_type, answer, config FROM guessr_puzzle WHERE players IS NULL ORDER BY id"
+    ).columns(config=JSONB)).all()
+
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        batch = rows[start:start + BACKFILL_BATCH_SIZE]
+        players_by_puzzle = _render_players([
+            _dao_config(puzzle_type, answer, config)
+            for _, puzzle_type, answer, config in batch
+        ])
+        bind.execute(
+            sa.text("UPDATE guessr_puzzle SET players = CAST(:players AS JSONB) WHERE id = :id"),
+            [{"id": row.id, "players": json.dumps(players)} for row, players in zip(batch, players_by_puzzle)],
+        )
+        print(f"Backfilled players for {start + len(batch)}/{len(rows)} puzzles")
+
+
+def downgrade() -> None:
+    op.drop_column('guessr_puzzle', 'players')
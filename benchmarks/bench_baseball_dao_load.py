@@ -0,0 +1,74 @@
+"""
+Compare cold-load time and peak RSS of BaseballCSVDAO when parsing the CSVs
+versus memory-mapping an Arrow snapshot, and the extra cost of materializing
+the puzzle lookup table on top of a snapshot load.
+
+Each measurement runs in a fresh interpreter so neither path benefits from
+the other's warm state.
+
+Usage:
+    python -m benchmarks.bench_baseball_dao_load [--base-dir DIR] [--runs N]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+CHILD = """
+import json, resource, sys, time
+from pathlib import Path
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+
+base_dir = Path(sys.argv[1]) if sys.argv[1] else None
+snapshot_dir = Path(sys.argv[2]) if sys.argv[2] else None
+materialize = sys.argv[3] == "1"
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+dao = BaseballCSVDAO(base_dir=base_dir, snapshot_dir=snapshot_dir, materialize=materialize)
+dao.warm_up()
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": elapsed, "rss_kb": rss_after, "rss_delta_kb": rss_after - rss_before}))
+"""
+
+
+def _run(base_dir: str, snapshot_dir: str, materialize: bool = False) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, base_dir, snapshot_dir, "1" if materialize else "0"],
+        check=True, capture_output=True, text=True, cwd=Path(__file__).parent.parent,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _report(label: str, samples: list[dict]) -> None:
+    seconds = statistics.median(s["seconds"] for s in samples)
+    rss = statistics.median(s["rss_kb"] for s in samples) / 1024
+    delta = statistics.median(s["rss_delta_kb"] for s in samples) / 1024
+    print(f"{label:<10} load {seconds * 1000:8.1f} ms   peak RSS {rss:7.1f} MiB   (+{delta:.1f} MiB during load)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", default="", help="Directory containing the Lahman CSVs")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        csv_samples = [_run(args.base_dir, "") for _ in range(args.runs)]
+        # First run builds the snapshot; it is reported separately
+        build = _run(args.base_dir, snapshot_dir)
+        snapshot_samples = [_run(args.base_dir, snapshot_dir) for _ in range(args.runs)]
+        table_samples = [_run(args.base_dir, snapshot_dir, materialize=True) for _ in range(args.runs)]
+
+    print(f"median of {args.runs} cold starts")
+    _report("csv", csv_samples)
+    _report("build", [build])
+    _report("snapshot", snapshot_samples)
+    _report("+table", table_samples)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Report the estimated in-memory size of every BaseballCSVDAO frame for a full
+load versus a lean load (column projection, integer downcasting, categorical IDs).
+
+Usage:
+    python -m benchmarks.bench_baseball_dao_memory [--base-dir DIR]
+"""
+import argparse
+from pathlib import Path
+
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", default=None, help="Directory containing the Lahman CSVs")
+    args = parser.parse_args()
+    base_dir = Path(args.base_dir) if args.base_dir else None
+
+    full_dao = BaseballCSVDAO(base_dir=base_dir)
+    lean_dao = BaseballCSVDAO(base_dir=base_dir, lean=True)
+    full_dao.warm_up()
+    lean_dao.warm_up()
+    full, lean = full_dao.frame_sizes(), lean_dao.frame_sizes()
+
+    print(f"{'frame':<22}{'full MiB':>10}{'lean MiB':>10}{'saved':>8}")
+    for name in full:
+        print(f"{name:<22}{full[name] / 2**20:>10.2f}{lean[name] / 2**20:>10.2f}{1 - lean[name] / full[name]:>8.0%}")
+    total_full, total_lean = sum(full.values()), sum(lean.values())
+    print(f"{'total':<22}{total_full / 2**20:>10.2f}{total_lean / 2**20:>10.2f}{1 - total_lean / total_full:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Simulate several years of daily guessr generation and compare the former
+100-attempt rejection loop with candidate-set sampling
+(GuessrService._select_puzzle_configs).
+
+Both keep a rolling 365-day window of used configurations. Reports draws per
+puzzle, picks that silently reused a configuration or were not feasible
+(legacy loop only), and selection latency per day.
+
+Usage:
+    python -m benchmarks.bench_guessr_generation [--base-dir DIR] [--years N]
+"""
+from collections import deque
+from datetime import date, timedelta
+import argparse
+import random
+import statistics
+import time
+from pathlib import Path
+
+from src.dao.baseball_csv_dao import BaseballCSVDAO, PUZZLE_KEYS
+from src.service.guessr_service import GuessrService
+
+
+def legacy_select(puzzle_date: date, used_configs: set, min_year: int, max_year: int) -> tuple[list[tuple], int]:
+    """The pre-index rejection loop: random tuples until one is unused, keeping the last after 100 tries."""
+    rng = random.Random(int(puzzle_date.strftime("%Y%m%d")))
+    selections, draws = [], 0
+    for _ in range(3):
+        for _ in range(100):
+            draws += 1
+            puzzle_type = rng.choice(list(PUZZLE_KEYS))
+            answer = rng.randint(min_year, max_year)
+            league = rng.choice(["AL", "NL"])
+            config = (puzzle_type, answer, league, rng.choice(PUZZLE_KEYS[puzzle_type]))
+            if config not in used_configs:
+                break
+        selections.append(config)
+    return selections, draws
+
+
+def simulate(select, days: int, start: date) -> dict:
+    window = deque()
+    used_configs = set()
+    draws, reused, latencies = 0, 0, []
+
+    for day in range(days):
+        puzzle_date = start + timedelta(days=day)
+        began = time.perf_counter()
+        selections, day_draws = select(puzzle_date, used_configs)
+        latencies.append((time.perf_counter() - began) * 1000)
+        draws += day_draws
+        reused += sum(config in used_configs for config in selections)
+
+        window.append(selections)
+        if len(window) > 365:
+            window.popleft()
+        used_configs = {config for day_configs in window for config in day_configs}
+
+    return {
+        "draws": draws / (days * 3),
+        "reused": reused,
+        "selections": [config for day_configs in window for config in day_configs],
+        "p50": statistics.median(latencies),
+        "p99": statistics.quantiles(latencies, n=100)[98],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", default=None, help="Directory containing the Lahman CSVs")
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+
+    dao = BaseballCSVDAO(base_dir=Path(args.base_dir) if args.base_dir else None)
+    feasible = {
+        (puzzle_type, *config)
+        for puzzle_type, configs in dao.get_feasible_configs().items()
+        for config in configs
+    }
+    service = GuessrService(guessr_dao=None, baseball_dao=dao)
+    days, start = args.years * 365, date(2025, 1, 1)
+
+    def candidate_select(puzzle_date, used_configs):
+        selections = service._select_puzzle_configs(puzzle_date, used_configs)
+        return [GuessrService._dao_config(t, answer, config) for _, t, answer, config in selections], 3
+
+    results = {
+        "rejection loop": simulate(lambda d, used: legacy_select(d, used, dao.min_year, dao.max_year), days, start),
+        "candidate set": simulate(candidate_select, days, start),
+    }
+
+    print(f"{days} days, {len(feasible)} feasible configurations")
+    print(f"{'strategy':<16}{'draws/puzzle':>14}{'reused':>8}{'infeasible*':>13}{'p50 ms':>9}{'p99 ms':>9}")
+    for name, result in results.items():
+        infeasible = sum(config not in feasible for config in result["selections"])
+        print(
+            f"{name:<16}{result['draws']:>14.2f}{result['reused']:>8}{infeasible:>13}"
+            f"{result['p50']:>9.3f}{result['p99']:>9.3f}"
+        )
+    print("* among the final year's puzzles")
+
+
+if __name__ == "__main__":
+    main()
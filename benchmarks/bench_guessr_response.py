@@ -0,0 +1,115 @@
+"""
+Measure per-request CPU of GET /guessr on a warm cache, with the
+pre-serialized response cache (the router's current path) versus the former
+path that returned the GuessrListView through response_model validation and
+JSON encoding. Also reports a revalidation request answered with 304.
+
+Requests are driven straight through the ASGI app, so the figures include
+routing, dependency injection and threadpool dispatch but no network I/O.
+Needs the app's environment (.env), as when running the server; the guessr
+DB is stubbed out and player lists come from the real CSVs.
+
+Usage:
+    python -m benchmarks.bench_guessr_response [--base-dir DIR] [--requests N]
+"""
+from datetime import date, datetime, UTC
+from pathlib import Path
+from unittest.mock import MagicMock
+import argparse
+import asyncio
+import time
+
+from fastapi import Depends, FastAPI, Query
+
+from src.config.dependency import get_guessr_service
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+from src.dao.guessr_dao import GuessrDAO
+from src.model.db.guessr_orm import GuessrORM, GuessrPuzzleORM
+from src.model.view.guessr_list_view import GuessrListView
+from src.router import guessr_router
+from src.service.guessr_service import GuessrService
+
+PUZZLE_DATE = date(2025, 6, 1)
+
+
+def build_app(baseball_dao: BaseballCSVDAO) -> FastAPI:
+    guessr_dao = MagicMock(spec=GuessrDAO)
+    guessr_dao.get_guessr_by_date.return_value = GuessrORM(id=1, date=PUZZLE_DATE, created_at=datetime.now(UTC))
+    guessr_dao.get_puzzles_by_guessr_id.return_value = [
+        GuessrPuzzleORM(puzzle_number=0, puzzle_type="batting_stat", answer=1998, config={"league": "NL", "stat": "HR"}),
+        GuessrPuzzleORM(puzzle_number=1, puzzle_type="award_votes", answer=1985, config={"league": "AL", "award": "Most Valuable Player"}),
+        GuessrPuzzleORM(puzzle_number=2, puzzle_type="starters", answer=2010, config={"league": "AL", "position": "SS"}),
+    ]
+
+    app = FastAPI()
+    app.include_router(guessr_router.router)
+    app.dependency_overrides[get_guessr_service] = lambda: GuessrService(guessr_dao, baseball_dao)
+
+    @app.get("/legacy", response_model=GuessrListView)
+    def legacy_get_puzzles(
+        date: date = Query(...),
+        service: GuessrService = Depends(get_guessr_service),
+    ):
+        guessr_router._validate_date_not_future(date)
+        return service.get_puzzles_for_date(date)
+
+    return app
+
+
+async def request(app: FastAPI, path: str, headers: list[tuple[bytes, bytes]] = ()) -> tuple[int, bytes]:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": f"date={PUZZLE_DATE}".encode(), "headers": list(headers),
+        "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[0]["status"], b"".join(m.get("body", b"") for m in messages[1:])
+
+
+async def measure(app: FastAPI, path: str, requests: int, headers=()) -> tuple[float, float]:
+    """Returns (CPU microseconds per request, wall microseconds per request)."""
+    await request(app, path, headers)
+    cpu, wall = time.process_time(), time.perf_counter()
+    for _ in range(requests):
+        await request(app, path, headers)
+    return (time.process_time() - cpu) / requests * 1e6, (time.perf_counter() - wall) / requests * 1e6
+
+
+async def run(app: FastAPI, requests: int) -> None:
+    status, body = await request(app, "/guessr/")
+    legacy_status, legacy_body = await request(app, "/legacy")
+    assert status == legacy_status == 200 and body == legacy_body, "cached bytes differ from the response_model output"
+    etag = GuessrService._response_cache.values()[0].etag
+
+    results = {
+        "response_model (off)": await measure(app, "/legacy", requests),
+        "cached bytes (on)": await measure(app, "/guessr/", requests),
+        "304 revalidation": await measure(app, "/guessr/", requests, [(b"if-none-match", etag.encode())]),
+    }
+    print(f"{requests} warm requests, {len(body)} byte body")
+    print(f"{'path':<22}{'CPU us/req':>12}{'wall us/req':>13}")
+    for name, (cpu, wall) in results.items():
+        print(f"{name:<22}{cpu:>12.0f}{wall:>13.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", default=None, help="Directory containing the Lahman CSVs")
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    baseball_dao = BaseballCSVDAO(base_dir=Path(args.base_dir) if args.base_dir else None)
+    asyncio.run(run(build_app(baseball_dao), args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Measure the total memory of N worker processes that each hold a warmed
+BaseballCSVDAO, with private CSV-parsed frames versus frames memory-mapped
+from a shared snapshot directory (e.g. /dev/shm).
+
+RSS counts shared pages once per process, so PSS (proportional set size,
+shared pages split between the processes mapping them) is the number that
+shows whether adding workers multiplies the dataset's footprint.
+
+Linux only (reads /proc/<pid>/smaps_rollup).
+
+Usage:
+    python -m benchmarks.bench_worker_rss [--base-dir DIR] [--shared-dir /dev/shm/baseball] [--lean]
+"""
+import argparse
+import multiprocessing
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+
+WORKER_COUNTS = [1, 2, 4]
+
+
+def _worker(base_dir: str | None, snapshot_dir: str | None, lean: bool, ready, done) -> None:
+    dao = BaseballCSVDAO(
+        base_dir=Path(base_dir) if base_dir else None,
+        snapshot_dir=Path(snapshot_dir) if snapshot_dir else None,
+        lean=lean,
+    )
+    dao.warm_up()
+    ready.release()
+    done.wait()
+
+
+def _memory_kb(pid: int) -> dict[str, int]:
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        fields = (line.split() for line in f)
+        return {parts[0].rstrip(":"): int(parts[1]) for parts in fields if len(parts) == 3}
+
+
+def _measure(workers: int, base_dir: str | None, snapshot_dir: str | None, lean: bool) -> tuple[float, float]:
+    context = multiprocessing.get_context("spawn")
+    ready, done = context.Semaphore(0), context.Event()
+    processes = [
+        context.Process(target=_worker, args=(base_dir, snapshot_dir, lean, ready, done))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for _ in processes:
+        ready.acquire()
+
+    usage = [_memory_kb(process.pid) for process in processes]
+    done.set()
+    for process in processes:
+        process.join()
+    return sum(u["Rss"] for u in usage) / 1024, sum(u["Pss"] for u in usage) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", default=None, help="Directory containing the Lahman CSVs")
+    parser.add_argument("--shared-dir", default=None, help="Snapshot directory to share (default: a fresh dir in /dev/shm)")
+    parser.add_argument("--lean", action="store_true", help="Use the lean load mode")
+    args = parser.parse_args()
+
+    shared_dir = args.shared_dir or tempfile.mkdtemp(prefix="baseball-", dir="/dev/shm")
+    try:
+        # Build the snapshot once up front so every measured worker attaches to it
+        _measure(1, args.base_dir, shared_dir, args.lean)
+
+        print(f"{'workers':<9}{'private RSS':>13}{'private PSS':>13}{'shared RSS':>12}{'shared PSS':>12}  (MiB, summed)")
+        for workers in WORKER_COUNTS:
+            private_rss, private_pss = _measure(workers, args.base_dir, None, args.lean)
+            shared_rss, shared_pss = _measure(workers, args.base_dir, shared_dir, args.lean)
+            print(f"{workers:<9}{private_rss:>13.1f}{private_pss:>13.1f}{shared_rss:>12.1f}{shared_pss:>12.1f}")
+    finally:
+        if not args.shared_dir:
+            shutil.rmtree(shared_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,34 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from src.config.settings import get_settings
 from src.config.middleware import apply_middleware
-from src.router import health_router, subscriber_router, content_router, guessr_router
+from src.config.dependency import get_baseball_dataset_manager, get_guessr_catalog, get_guessr_scheduler
+from src.router import health_router, subscriber_router, content_router, guessr_router, admin_router
 
 settings = get_settings()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background work on startup; baseball data preloads without blocking requests."""
+    manager = get_baseball_dataset_manager()
+    if settings.baseball_warmup:
+        manager.get_dao().start_warmup()
+    if settings.baseball_reload_poll_seconds > 0:
+        manager.start_watching(settings.baseball_reload_poll_seconds)
+    # Fail fast on an unreadable catalog rather than on the first request
+    get_guessr_catalog()
+    if settings.guessr_pregenerate:
+        get_guessr_scheduler().start()
+    yield
+    get_guessr_scheduler().stop()
+    manager.stop_watching()
+
+
 def create_app() -> FastAPI:
     """Application factory pattern."""
-    app = FastAPI(title=settings.api_title, version=settings.api_version)
+    app = FastAPI(title=settings.api_title, version=settings.api_version, lifespan=lifespan)
 
     apply_middleware(app, settings)
 
@@ -17,6 +36,7 @@ def create_app() -> FastAPI:
     app.include_router(subscriber_router.router)
     app.include_router(content_router.router)
     app.include_router(guessr_router.router)
+    app.include_router(admin_router.router)
 
     return app
 
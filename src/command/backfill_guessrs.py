@@ -0,0 +1,107 @@
+"""
+Generate and store the guessrs of a date range in bulk.
+
+    python -m src.command.backfill_guessrs --start 2025-01-01 --end 2025-12-31 --workers 4
+
+Dates that already have a guessr are skipped, and --end may not be after today
+(upcoming guessrs come from the catalog). Configurations are chosen in
+date order exactly as on-demand generation would (see
+GuessrService.backfill_guessrs); player lists are computed in batched queries,
+split across --workers processes, and each --batch-days dates are written with
+one INSERT for the guessrs and one for their puzzles.
+
+Worker processes each load the baseball data, so a pool pays off for multi-year
+ranges; set BASEBALL_SNAPSHOT_DIR so they memory-map one shared copy.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+import argparse
+import multiprocessing
+import time
+
+from src.config.settings import get_settings
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+from src.dao.guessr_dao import GuessrDAO
+from src.model.baseball_manifest import DEFAULT_BASE_DIR
+from src.service.guessr_service import GuessrService, PUZZLE_TIMEZONE
+from src.util.database_manager import DatabaseManager
+
+# Each worker receives about this many chunks of configs, to even out their load
+CHUNKS_PER_WORKER = 4
+
+_worker_dao: BaseballCSVDAO | None = None
+
+
+def _create_baseball_dao(base_dir: Path) -> BaseballCSVDAO:
+    settings = get_settings()
+    return BaseballCSVDAO(
+        base_dir=base_dir,
+        snapshot_dir=Path(settings.baseball_snapshot_dir) if settings.baseball_snapshot_dir else None,
+        lean=settings.baseball_lean_load,
+    )
+
+
+def _init_worker(base_dir: Path) -> None:
+    global _worker_dao
+    _worker_dao = _create_baseball_dao(base_dir)
+
+
+def _fetch_players_in_worker(configs: list[tuple[str, int, str, str]]) -> list[list[dict]]:
+    return _worker_dao.get_players_for_configs(configs)
+
+
+def fetch_players_in_pool(configs: list[tuple[str, int, str, str]], base_dir: Path, workers: int) -> list[list[dict]]:
+    """
+    Evaluate configs across a pool of worker processes; returns player lists in input order.
+    Workers are spawned rather than forked, since forking a process whose polars
+    thread pool is running can deadlock the child.
+    """
+    chunk_size = max(1, -(-len(configs) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [configs[i:i + chunk_size] for i in range(0, len(configs), chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(base_dir,),
+    ) as pool:
+        return [players for chunk in pool.map(_fetch_players_in_worker, chunks) for players in chunk]
+
+
+def backfill(
+    database_manager: DatabaseManager,
+    baseball_dao: BaseballCSVDAO,
+    start_date: date,
+    end_date: date,
+    workers: int = 1,
+    batch_days: int = 100,
+) -> list[date]:
+    with database_manager.session_scope() as session:
+        service = GuessrService(GuessrDAO(session), baseball_dao)
+        fetch_players = (lambda configs: fetch_players_in_pool(configs, baseball_dao.base_dir, workers)) if workers > 1 else None
+        return service.backfill_guessrs(start_date, end_date, batch_days, fetch_players)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", type=Path, default=DEFAULT_BASE_DIR)
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="First date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, required=True, help="Last date (YYYY-MM-DD), inclusive")
+    parser.add_argument("--workers", type=int, default=1, help="Processes computing player lists (1 runs in-process)")
+    parser.add_argument("--batch-days", type=int, default=100, help="Dates written per transaction")
+    args = parser.parse_args()
+    if args.end < args.start:
+        parser.error("--end must not be before --start")
+    today = datetime.now(PUZZLE_TIMEZONE).date()
+    if args.end > today:
+        parser.error(f"--end must not be after today ({today}); upcoming guessrs come from the catalog")
+
+    started = time.perf_counter()
+    database_manager = DatabaseManager(get_settings().database_url, quiet=True)
+    written = backfill(database_manager, _create_baseball_dao(args.base_dir), args.start, args.end, args.workers, args.batch_days)
+    print(f"Backfilled {len(written)} guessrs between {args.start} and {args.end} "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
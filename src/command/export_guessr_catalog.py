@@ -0,0 +1,64 @@
+"""
+Precompute the puzzles of upcoming dates into a catalog file.
+
+    python -m src.command.export_guessr_catalog --days 90 --output guessr_catalog.json.gz
+
+Selection is seeded by date, so the schedule can be computed ahead of time:
+starting at --start (default: today, US Eastern), every date without a guessr
+gets its configs, answers and rendered players planned exactly as on-demand
+generation would, against the puzzles already stored in the past year. The
+database is only read.
+
+Point GUESSR_CATALOG_PATH at the file and the app stores each date from it on
+first use instead of generating it. Re-export after the dataset version
+changes; the app ignores a catalog built from another version.
+"""
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import argparse
+
+from src.config.settings import get_settings
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+from src.dao.guessr_dao import GuessrDAO
+from src.model.baseball_manifest import DEFAULT_BASE_DIR
+from src.model.guessr_catalog import GuessrCatalog
+from src.service.guessr_service import GuessrService, PUZZLE_TIMEZONE
+from src.util.database_manager import DatabaseManager
+
+
+def export_catalog(
+    database_manager: DatabaseManager,
+    baseball_dao: BaseballCSVDAO,
+    start_date: date,
+    days: int,
+) -> GuessrCatalog:
+    end_date = start_date + timedelta(days=days - 1)
+    with database_manager.session_scope() as session:
+        guessr_dao = GuessrDAO(session)
+        existing = guessr_dao.get_guessr_dates_in_range(start_date, end_date)
+        puzzle_dates = [
+            start_date + timedelta(days=n) for n in range(days)
+            if start_date + timedelta(days=n) not in existing
+        ]
+        planned = GuessrService(guessr_dao, baseball_dao).plan_guessrs(puzzle_dates)
+    return GuessrCatalog(dataset_version=baseball_dao.dataset_version, days=planned)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", type=Path, default=DEFAULT_BASE_DIR)
+    parser.add_argument("--start", type=date.fromisoformat, help="First date (YYYY-MM-DD, default today)")
+    parser.add_argument("--days", type=int, default=90, help="Number of dates to cover")
+    parser.add_argument("--output", type=Path, required=True, help="Catalog file to write")
+    args = parser.parse_args()
+
+    start_date = args.start or datetime.now(PUZZLE_TIMEZONE).date()
+    database_manager = DatabaseManager(get_settings().database_url, quiet=True)
+    catalog = export_catalog(database_manager, BaseballCSVDAO(base_dir=args.base_dir), start_date, args.days)
+    catalog.write(args.output)
+    print(f"Wrote {args.output}: {len(catalog.days)} dates from {start_date} "
+          f"(dataset {catalog.dataset_version}), {args.output.stat().st_size} bytes")
+
+
+if __name__ == "__main__":
+    main()
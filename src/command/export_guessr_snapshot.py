@@ -0,0 +1,90 @@
+"""
+Render past guessr responses to a static, pre-compressed directory tree.
+
+    python -m src.command.export_guessr_snapshot --output /srv/guessr-static [--incremental]
+
+For every stored guessr dated before today (US Eastern) it writes:
+
+    guessr/date/2025-01-15.json.gz   body of GET /guessr/?date=2025-01-15
+    guessr/summary.json.gz           body of GET /guessr/summary, listing those dates
+
+Bodies are byte-identical to the API's and gzip-compressed: upload them with
+Content-Type: application/json and Content-Encoding: gzip so object storage or
+a CDN can serve archive traffic without the app. A date's puzzles never change,
+so --incremental only renders dates whose file is missing; the summary is
+always rewritten. Every file is replaced atomically.
+"""
+from datetime import date, datetime
+from pathlib import Path
+import argparse
+import gzip
+import os
+
+from pydantic import TypeAdapter
+
+from src.config.settings import get_settings
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+from src.dao.guessr_dao import GuessrDAO
+from src.model.baseball_manifest import DEFAULT_BASE_DIR
+from src.model.view.guessr_item_view import GuessrItemView
+from src.model.view.serialized_view import SerializedView
+from src.service.guessr_service import GuessrService, PUZZLE_TIMEZONE
+from src.util.database_manager import DatabaseManager
+
+_summary_adapter = TypeAdapter(list[GuessrItemView])
+
+
+def _date_path(output: Path, puzzle_date: date) -> Path:
+    return output / "guessr" / "date" / f"{puzzle_date}.json.gz"
+
+
+def _write_gzip(path: Path, body: bytes) -> None:
+    """Write body gzip-compressed via a temp file, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    # mtime=0 keeps unchanged responses byte-identical between exports
+    tmp_path.write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+    os.replace(tmp_path, path)
+
+
+def export_snapshot(
+    database_manager: DatabaseManager,
+    baseball_dao: BaseballCSVDAO,
+    output: Path,
+    incremental: bool = False,
+    today: date | None = None,
+) -> list[date]:
+    """
+    Returns:
+        The dates whose responses were written
+    """
+    today = today or datetime.now(PUZZLE_TIMEZONE).date()
+    with database_manager.session_scope() as session:
+        service = GuessrService(GuessrDAO(session), baseball_dao)
+        items = [item for item in service.get_all_guessrs() if date.fromisoformat(item.date) < today]
+        pending = [
+            date.fromisoformat(item.date) for item in items
+            if not (incremental and _date_path(output, date.fromisoformat(item.date)).exists())
+        ]
+        views = service.get_stored_guessrs(pending)
+
+    for view in views:
+        _write_gzip(_date_path(output, date.fromisoformat(view.date)), SerializedView.from_model(view).body)
+    _write_gzip(output / "guessr" / "summary.json.gz", _summary_adapter.dump_json(items))
+    return [date.fromisoformat(view.date) for view in views]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", type=Path, default=DEFAULT_BASE_DIR)
+    parser.add_argument("--output", type=Path, required=True, help="Root of the static tree")
+    parser.add_argument("--incremental", action="store_true", help="Only render dates not exported yet")
+    args = parser.parse_args()
+
+    database_manager = DatabaseManager(get_settings().database_url, quiet=True)
+    written = export_snapshot(database_manager, BaseballCSVDAO(base_dir=args.base_dir), args.output, args.incremental)
+    print(f"Wrote {len(written)} guessr responses and the summary under {args.output / 'guessr'}")
+
+
+if __name__ == "__main__":
+    main()
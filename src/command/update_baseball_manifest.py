@@ -0,0 +1,47 @@
+"""
+Refresh the baseball manifest after replacing the CSVs.
+
+    python -m src.command.update_baseball_manifest --version 2025.1 --max-year 2025
+
+Writes the sha256 of every CSV into manifest.json. Run it after the CSVs are in
+place: a running app with BASEBALL_RELOAD_POLL_SECONDS set reloads as soon as
+the manifest changes.
+"""
+from pathlib import Path
+import argparse
+
+from src.dao.baseball_csv_dao import DATASETS
+from src.model.baseball_manifest import BaseballManifest, DEFAULT_BASE_DIR, file_sha256
+
+
+def update_manifest(base_dir: Path, version: str | None = None, max_year: int | None = None) -> BaseballManifest:
+    manifest = BaseballManifest.load(base_dir)
+    files = {}
+    for csv_name, _ in DATASETS.values():
+        path = base_dir / csv_name
+        if path.exists():
+            files[csv_name] = file_sha256(path)
+
+    manifest = manifest.model_copy(update={
+        "version": version or manifest.version,
+        "max_year": max_year or manifest.max_year,
+        "files": files,
+    })
+    manifest.write(base_dir)
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", type=Path, default=DEFAULT_BASE_DIR)
+    parser.add_argument("--version", help="New dataset version (defaults to the current one)")
+    parser.add_argument("--max-year", type=int, help="Last season in the dataset")
+    args = parser.parse_args()
+
+    manifest = update_manifest(args.base_dir, args.version, args.max_year)
+    print(f"Wrote {args.base_dir / 'manifest.json'}: version {manifest.version}, "
+          f"{manifest.min_year}-{manifest.max_year}, {len(manifest.files)} files hashed")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
+from datetime import timedelta
 from functools import lru_cache
+from pathlib import Path
 from sqlalchemy.orm import Session
 from typing import Generator
 from fastapi import Depends
@@ -11,8 +13,13 @@ from src.util.database_manager import DatabaseManager
 from src.dao.contact_dao import ContactDAO
 from src.service.subscriber_service import SubscriberService
 from src.dao.baseball_csv_dao import BaseballCSVDAO
+from src.util.baseball_dataset_manager import BaseballDatasetManager
 from src.dao.guessr_dao import GuessrDAO
-from src.service.guessr_service import GuessrService
+from src.service.guessr_service import GuessrService, create_guessr_cache
+from src.model.guessr_catalog import GuessrCatalog
+from src.util.guessr_scheduler import GuessrScheduler
+from src.util.tiered_cache import CacheBackend, RedisCacheBackend, SqliteCacheBackend, TieredCache
+from src.model.view.guessr_list_view import GuessrListView
 
 settings = get_settings()
 
@@ -52,18 +59,57 @@ def get_content_service() -> ContentService:
     return ContentService()
 
 
+def _create_baseball_csv_dao() -> BaseballCSVDAO:
+    snapshot_dir = Path(settings.baseball_snapshot_dir) if settings.baseball_snapshot_dir else None
+    return BaseballCSVDAO(
+        snapshot_dir=snapshot_dir,
+        materialize=settings.baseball_materialize_puzzles,
+        lean=settings.baseball_lean_load,
+    )
+
+
 @lru_cache()
+def get_baseball_dataset_manager() -> BaseballDatasetManager:
+    return BaseballDatasetManager(_create_baseball_csv_dao)
+
+
 def get_baseball_csv_dao() -> BaseballCSVDAO:
-    """Singleton CSV DAO - loads once per application lifecycle."""
-    return BaseballCSVDAO()
+    """Active CSV DAO - loads once, and is swapped atomically when the dataset is reloaded."""
+    return get_baseball_dataset_manager().get_dao()
 
 
 def get_guessr_dao(db: Session = Depends(get_db)) -> GuessrDAO:
     return GuessrDAO(db)
 
 
+@lru_cache()
+def get_guessr_catalog() -> GuessrCatalog | None:
+    return GuessrCatalog.load(Path(settings.guessr_catalog_path)) if settings.guessr_catalog_path else None
+
+
+@lru_cache()
+def get_guessr_cache() -> TieredCache[GuessrListView]:
+    l2: CacheBackend | None = None
+    if settings.guessr_cache_redis_url:
+        l2 = RedisCacheBackend(settings.guessr_cache_redis_url)
+    elif settings.guessr_cache_sqlite_path:
+        l2 = SqliteCacheBackend(Path(settings.guessr_cache_sqlite_path))
+    return create_guessr_cache(l2)
+
+
 def get_guessr_service(
     guessr_dao: GuessrDAO = Depends(get_guessr_dao),
     baseball_dao: BaseballCSVDAO = Depends(get_baseball_csv_dao)
 ) -> GuessrService:
-    return GuessrService(guessr_dao, baseball_dao)
+    return GuessrService(guessr_dao, baseball_dao, get_guessr_catalog(), get_guessr_cache())
+
+
+@lru_cache()
+def get_guessr_scheduler() -> GuessrScheduler:
+    return GuessrScheduler(
+        get_database_manager(),
+        get_baseball_csv_dao,
+        lead_time=timedelta(minutes=settings.guessr_pregenerate_lead_minutes),
+        catalog=get_guessr_catalog(),
+        cache=get_guessr_cache(),
+    )
@@ -13,6 +13,31 @@ class Settings(BaseSettings):
     database_url: str
     google_cloud_project: str = "portfolio-477017"
     google_oauth_client_id: str
+    # Shared secret for admin endpoints (X-API-Key header); admin endpoints are disabled if unset
+    api_key: str | None = None
+
+    # Directory for memory-mapped Arrow snapshots of the baseball CSVs (disabled if unset)
+    baseball_snapshot_dir: str | None = None
+    # Precompute every puzzle's player list when the baseball data loads
+    baseball_materialize_puzzles: bool = False
+    # Load only the queried columns with downcast dtypes to reduce per-worker memory
+    baseball_lean_load: bool = False
+    # Poll the baseball manifest.json this often and hot-reload on change (0 disables)
+    baseball_reload_poll_seconds: int = 0
+    # Preload the baseball CSVs at startup; instances only serving stored puzzles can skip it
+    baseball_warmup: bool = True
+    # Generate and cache the next day's guessr this long before midnight US Eastern
+    guessr_pregenerate: bool = True
+    guessr_pregenerate_lead_minutes: int = 30
+    # Store upcoming dates' puzzles from this catalog instead of generating them
+    # (written by src.command.export_guessr_catalog; ignored once the dataset version changes)
+    guessr_catalog_path: str | None = None
+    # Share cached guessrs across instances through this Redis-protocol server, e.g.
+    # redis://10.0.0.3:6379/0 (in-process cache only if unset)
+    guessr_cache_redis_url: str | None = None
+    # Otherwise keep cached guessrs in this local SQLite file, shared by the host's workers
+    # and across restarts (disabled if unset)
+    guessr_cache_sqlite_path: str | None = None
 
     api_title: str = "Portfolio API"
     api_version: str = "1.0.0"
@@ -1,33 +1,659 @@
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterable, Iterator
+import hashlib
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
 import polars as pl
 
+from src.model.baseball_manifest import BaseballManifest, DEFAULT_BASE_DIR, file_sha256
+
+try:
+    import fcntl
+except ImportError:  # Windows: snapshot builds are not coordinated across processes
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+PARTITION_KEYS = ["yearID", "lgID"]
+
+# Puzzle configuration space served by the guessr game
+BATTING_STATS = ["HR", "RBI", "H", "SB"]
+PITCHING_STATS = ["W", "SO", "ERA", "SV"]
+AWARDS = ["Most Valuable Player", "Cy Young Award", "Rookie of the Year"]
+POSITIONS = ["C", "1B", "2B", "3B", "SS", "LF", "CF", "RF"]
+OUTFIELD_POSITIONS = ["LF", "CF", "RF"]
+PUZZLE_KEYS = {
+    "batting_stat": BATTING_STATS,
+    "pitching_stat": PITCHING_STATS,
+    "award_votes": AWARDS,
+    "starters": POSITIONS,
+}
+PUZZLE_TOP_N = 10
+# Fewest vote getters an award puzzle may list (a lone name would give the answer away)
+AWARD_MIN_VOTE_GETTERS = 3
+# Leagues puzzles are drawn from; "ML" covers awards given across both leagues
+PUZZLE_LEAGUES = ["AL", "NL"]
+AWARD_LEAGUES = [*PUZZLE_LEAGUES, "ML"]
+
+# Minimum IPouts (162 innings) for an ERA leaderboard qualifier
+ERA_MIN_IPOUTS = 486
+
+# Frame attribute -> (source CSV, whether rows are partitioned by season)
+DATASETS = {
+    "batting_df": ("Batting.csv", True),
+    "pitching_df": ("Pitching.csv", True),
+    "people_df": ("People.csv", False),
+    "awards_df": ("AwardsSharePlayers.csv", True),
+    "fielding_df": ("Fielding.csv", True),
+    "fielding_of_split_df": ("FieldingOFsplit.csv", True),
+    "teams_df": ("Teams.csv", False),
+}
+
+# Datasets preloaded by warm_up(), most widely used first (names serve every puzzle)
+WARMUP_ORDER = ["people_df", "batting_df", "pitching_df", "awards_df", "fielding_df", "fielding_of_split_df"]
+
+# Columns the query methods read; lean loads project each frame to these
+DATASET_COLUMNS = {
+    "batting_df": ["playerID", "yearID", "lgID", *BATTING_STATS],
+    "pitching_df": ["playerID", "yearID", "lgID", "IPouts", *PITCHING_STATS],
+    "people_df": ["playerID", "nameFirst", "nameLast"],
+    "awards_df": ["awardID", "yearID", "lgID", "playerID", "pointsWon"],
+    "fielding_df": ["playerID", "yearID", "teamID", "lgID", "POS", "GS"],
+    "fielding_of_split_df": ["playerID", "yearID", "teamID", "lgID", "POS", "GS"],
+    "teams_df": ["yearID", "lgID", "teamID", "name"],
+}
+
+# Low-cardinality ID columns stored as categoricals by lean loads
+CATEGORICAL_COLUMNS = ["lgID", "POS", "awardID", "teamID"]
+
+
+def _sort_by_season(df: pl.DataFrame, min_year: int, max_year: int) -> pl.DataFrame:
+    """
+    Restrict a frame to the dataset's year window and sort it by (yearID, lgID).
+    playerID is stored as a categorical, since each ID repeats once per season.
+    """
+    return (
+        df
+        .filter(pl.col("yearID").is_between(min_year, max_year))
+        .with_columns(pl.col("playerID").cast(pl.Categorical))
+        .sort(PARTITION_KEYS, maintain_order=True)
+    )
+
+
+def _downcast(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Shrink integer columns to the smallest width that holds their values and
+    store ID columns as categoricals. Floats (ERA) stay Float64 so the values
+    served to clients are unchanged.
+    """
+    return df.with_columns(
+        *(df[column].shrink_dtype() for column, dtype in df.schema.items() if dtype == pl.Int64),
+        pl.col([column for column in CATEGORICAL_COLUMNS if column in df.columns]).cast(pl.Categorical),
+    )
+
+
+def _build_player_names(people_df: pl.DataFrame) -> dict[str, str | None]:
+    """Build the playerID -> "First Last" dimension used to name query results."""
+    full_names = people_df.select(
+        "playerID",
+        full_name=pl.concat_str([pl.col("nameFirst"), pl.col("nameLast")], separator=" "),
+    )
+    return dict(zip(full_names["playerID"].to_list(), full_names["full_name"].to_list()))
+
+
+def _index_seasons(sorted_df: pl.DataFrame) -> dict[tuple[int, str], tuple[int, int]]:
+    """
+    Index the row range of every season in a frame sorted by (yearID, lgID).
+
+    Returns a (yearID, lgID) -> (offset, length) mapping, so a season can be read
+    with a zero-copy slice instead of a full-frame filter.
+    """
+    bounds = (
+        sorted_df
+        .with_row_index("offset")
+        .group_by(PARTITION_KEYS, maintain_order=True)
+        .agg(pl.col("offset").first(), pl.len().alias("length"))
+    )
+    return {
+        (row["yearID"], row["lgID"]): (row["offset"], row["length"])
+        for row in bounds.iter_rows(named=True)
+    }
+
+
+@contextmanager
+def _exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock on lock_path, shared across processes.
+    Where fcntl is unavailable (Windows) this only creates the lock file.
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def source_fingerprint(path: Path) -> str:
+    """
+    Fingerprint a source CSV by modification time and content hash.
+    Any edit to the file produces a new fingerprint (and a new snapshot).
+    """
+    digest = hashlib.sha256(str(path.stat().st_mtime_ns).encode())
+    with open(path, "rb") as f:
+        digest.update(hashlib.file_digest(f, "sha256").digest())
+    return digest.hexdigest()
+
 
 class BaseballCSVDAO:
     """
-    Singleton that loads baseball CSVs once at startup.
+    Singleton that serves baseball CSV data.
     Provides methods to query top batters, pitchers, award winners, and starters.
+
+    Each dataset is loaded on first access, guarded by its own lock, so a request
+    only waits for the datasets it needs. warm_up() / start_warmup() preload them
+    in WARMUP_ORDER; frames no query reads (teams) are never loaded unless asked for.
+
+    Season-level frames are sorted by (yearID, lgID) at load time and indexed,
+    so each query only touches the rows of the requested season and league.
+    Player names are resolved through a playerID -> full name dimension built
+    once at load, rather than a join against People on every query.
+
+    When a snapshot_dir is given, each loaded frame is written there as an
+    uncompressed Arrow IPC file keyed by its source fingerprint. Later starts
+    memory-map those files instead of parsing the CSVs again, and worker
+    processes pointed at the same directory share one copy of the data.
+
+    get_feasible_configs() indexes every puzzle configuration that yields a
+    full-size player list, so puzzle generation never picks an empty one.
+
+    With materialize=True every puzzle configuration (see PUZZLE_KEYS) is
+    precomputed once, and the query methods serve those from a lookup table.
+
+    With lean=True only the columns in DATASET_COLUMNS are read, integers are
+    downcast and ID columns become categoricals. Queries on stats outside the
+    puzzle space are not supported in this mode.
+
+    The year window and dataset version come from the manifest.json next to
+    the CSVs (see BaseballManifest).
     """
 
-    def __init__(self):
-        base_dir = Path(__file__).parent.parent / "static" / "baseball"
+    def __init__(
+        self,
+        base_dir: Path | None = None,
+        snapshot_dir: Path | None = None,
+        materialize: bool = False,
+        lean: bool = False,
+    ):
+        self.base_dir = base_dir or DEFAULT_BASE_DIR
+        self.manifest = BaseballManifest.load(self.base_dir)
+        self.snapshot_dir = snapshot_dir
+        self.materialize = materialize
+        self.lean = lean
+
+        self._frames: dict[str, pl.DataFrame] = {}
+        self._season_indexes: dict[str, dict[tuple[int, str], tuple[int, int]]] = {}
+        self._locks = {name: threading.Lock() for name in DATASETS}
+        self._names_lock = threading.Lock()
+        self._table_lock = threading.Lock()
+        self._feasibility_lock = threading.Lock()
+        self._player_names: dict[str, str | None] | None = None
+        self._puzzle_table: dict[tuple[str, int, str, str], tuple[tuple, ...]] | None = None
+        self._feasible_configs: dict[str, tuple[tuple[int, str, str], ...]] | None = None
+
+    batting_df = property(lambda self: self._dataset("batting_df"))
+    pitching_df = property(lambda self: self._dataset("pitching_df"))
+    people_df = property(lambda self: self._dataset("people_df"))
+    awards_df = property(lambda self: self._dataset("awards_df"))
+    fielding_df = property(lambda self: self._dataset("fielding_df"))
+    fielding_of_split_df = property(lambda self: self._dataset("fielding_of_split_df"))
+    teams_df = property(lambda self: self._dataset("teams_df"))
+
+    @property
+    def dataset_version(self) -> str:
+        return self.manifest.version
+
+    @property
+    def min_year(self) -> int:
+        return self.manifest.min_year
+
+    @property
+    def max_year(self) -> int:
+        return self.manifest.max_year
+
+    def warm_up(self) -> None:
+        """Load every queried dataset in priority order, then any derived tables."""
+        for name in WARMUP_ORDER:
+            self._dataset(name)
+        self._get_player_names()
+        self.get_feasible_configs()
+        if self.materialize:
+            self._get_puzzle_table()
+
+    def start_warmup(self) -> threading.Thread:
+        """Run warm_up() on a daemon thread so app startup is not blocked."""
+        def run():
+            try:
+                self.warm_up()
+            except Exception:
+                logger.exception("Baseball data warmup failed; datasets will load on demand")
+
+        thread = threading.Thread(target=run, name="baseball-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def frame_sizes(self) -> dict[str, int]:
+        """Estimated in-memory size in bytes of each loaded frame."""
+        return {name: df.estimated_size() for name, df in self._frames.items()}
+
+    def _dataset(self, name: str) -> pl.DataFrame:
+        """
+        Return a dataset, loading it on first access.
+        Only callers of this dataset wait while it loads.
+        """
+        df = self._frames.get(name)
+        if df is None:
+            with self._locks[name]:
+                df = self._frames.get(name)
+                if df is None:
+                    df = self._load_dataset(name)
+                    if DATASETS[name][1]:
+                        self._season_indexes[name] = _index_seasons(df)
+                    self._frames[name] = df
+        return df
+
+    def _load_dataset(self, name: str) -> pl.DataFrame:
+        """Memory-map the dataset's snapshot if snapshots are enabled, otherwise parse its CSV."""
+        start = time.perf_counter()
+        if self.snapshot_dir:
+            df, source = self._load_shared(name)
+        else:
+            df, source = self._parse_csv(name), "csv"
+
+        logger.info(
+            "Loaded %s from %s in %.0f ms (%.1f MiB)",
+            name, source, (time.perf_counter() - start) * 1000, df.estimated_size() / 2**20,
+        )
+        return df
+
+    def _parse_csv(self, name: str) -> pl.DataFrame:
+        csv_name, by_season = DATASETS[name]
+        expected_hash = self.manifest.files.get(csv_name)
+        if expected_hash and file_sha256(self.base_dir / csv_name) != expected_hash:
+            logger.warning("%s does not match manifest %s; was the manifest updated?", csv_name, self.manifest.version)
+
+        if self.lean:
+            df = _downcast(pl.read_csv(self.base_dir / csv_name, columns=DATASET_COLUMNS[name]))
+        else:
+            df = pl.read_csv(self.base_dir / csv_name)
+        return _sort_by_season(df, self.min_year, self.max_year) if by_season else df
+
+    def _load_shared(self, name: str) -> tuple[pl.DataFrame, str]:
+        """
+        Memory-map the dataset's snapshot, building it first if needed.
+
+        The build runs under an exclusive file lock, so when several worker processes
+        start together only one parses the CSV; the others wait and then map the file
+        it wrote. The builder also maps the file rather than keeping its parsed copy,
+        so every process shares the same page-cache pages (zero-copy when the snapshot
+        directory is on tmpfs such as /dev/shm).
+        """
+        path = self._snapshot_path(name)
+        if path.exists():
+            try:
+                return pl.read_ipc(path, memory_map=True, rechunk=False), "snapshot"
+            except OSError as e:
+                # Removed since the check (superseded by a rebuild elsewhere); build it again
+                logger.warning("Could not map baseball snapshot %s, rebuilding: %s", path, e)
+
+        try:
+            with _exclusive_lock(path.parent / f".{path.name}.lock"):
+                source = "snapshot"
+                if not path.exists():
+                    df = self._parse_csv(name)
+                    source = "csv"
+                    if not self._write_snapshot(df, path):
+                        return df, source
+                    self._remove_stale_snapshots(name, path)
+                return pl.read_ipc(path, memory_map=True, rechunk=False), source
+        except OSError as e:
+            logger.warning("Could not build baseball snapshot %s: %s", path, e)
+            return self._parse_csv(name), "csv"
+
+    def _snapshot_path(self, name: str) -> Path:
+        fingerprint = source_fingerprint(self.base_dir / DATASETS[name][0])
+        return self.snapshot_dir / f"{name}-{fingerprint[:16]}{self._snapshot_tail()}"
+
+    def _snapshot_tail(self) -> str:
+        """The part of a snapshot's file name set by this DAO's configuration (year window, lean)."""
+        suffix = "-lean" if self.lean else ""
+        return f"-{self.min_year}-{self.max_year}{suffix}.arrow"
+
+    @staticmethod
+    def _write_snapshot(df: pl.DataFrame, path: Path) -> bool:
+        """
+        Write a frame as an uncompressed Arrow IPC file (so it can be memory-mapped).
+        The file is staged under a temp name and renamed into place, so readers never
+        see a partial snapshot. Failures are logged and serving continues from CSV.
+
+        Returns True if the snapshot was written.
+        """
+        try:
+            fd, staging = tempfile.mkstemp(dir=path.parent, prefix=".staging-")
+            os.close(fd)
+            df.write_ipc(staging, compression="uncompressed")
+            os.chmod(staging, 0o644)
+            os.replace(staging, path)
+            return True
+        except OSError as e:
+            logger.warning("Could not write baseball snapshot %s: %s", path, e)
+            return False
+
+    def _remove_stale_snapshots(self, name: str, current: Path) -> None:
+        """
+        Delete the dataset's snapshots of superseded sources (and their lock files)
+        once a new one is in place, so they stop holding memory on tmpfs.
+
+        Only snapshots with this DAO's configuration and another fingerprint are
+        removed; other year windows and lean/full builds sharing the directory are
+        left alone. Processes still mapping a deleted file keep their mapping until
+        they exit.
+        """
+        for stale in current.parent.glob(f"{name}-{'?' * 16}{self._snapshot_tail()}"):
+            if stale == current:
+                continue
+            for stale_path in (stale, stale.parent / f".{stale.name}.lock"):
+                try:
+                    stale_path.unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning("Could not remove stale baseball snapshot %s: %s", stale_path, e)
+
+    def get_feasible_configs(self) -> dict[str, tuple[tuple[int, str, str], ...]]:
+        """
+        Index of every puzzle configuration that yields a full-size player list.
+        Built once per dataset; puzzle generation samples only from it.
+
+        Returns: {puzzle_type: ((year, league, key), ...)}, each sorted
+        """
+        if self._feasible_configs is None:
+            with self._feasibility_lock:
+                if self._feasible_configs is None:
+                    self._feasible_configs = self._build_feasibility_index()
+        return self._feasible_configs
+
+    def _build_feasibility_index(self) -> dict[str, tuple[tuple[int, str, str], ...]]:
+        """
+        Count, per configuration, the players its query would return.
+        Only PUZZLE_LEAGUES (and AWARD_LEAGUES for awards) are indexed.
+
+        - Leaderboards need PUZZLE_TOP_N players with a value (ERA: qualifiers only).
+        - Award votes need AWARD_MIN_VOTE_GETTERS vote getters; pre-split awards
+          only appear under their combined league ("ML").
+        - Starters need a starter for every team that fielded players that
+          season, which excludes outfield positions before FieldingOFsplit
+          coverage begins (1954).
+        """
+        start = time.perf_counter()
+        configs = {puzzle_type: [] for puzzle_type in PUZZLE_KEYS}
+
+        for puzzle_type, df, stats in (
+            ("batting_stat", self.batting_df, BATTING_STATS),
+            ("pitching_stat", self.pitching_df, PITCHING_STATS),
+        ):
+            for stat in stats:
+                qualified = df.filter(pl.col("IPouts") > ERA_MIN_IPOUTS) if stat == "ERA" else df
+                counts = (
+                    qualified
+                    .filter(pl.col("lgID").is_in(PUZZLE_LEAGUES))
+                    .group_by(PARTITION_KEYS)
+                    .agg(pl.col(stat).count().alias("players"))
+                )
+                configs[puzzle_type].extend(
+                    (year, league, stat)
+                    for year, league, players in counts.iter_rows()
+                    if players >= PUZZLE_TOP_N
+                )
+
+        award_seasons = (
+            self.awards_df
+            .filter(pl.col("awardID").is_in(AWARDS) & pl.col("lgID").is_in(AWARD_LEAGUES))
+            .group_by([*PARTITION_KEYS, "awardID"])
+            .len("vote_getters")
+            .filter(pl.col("vote_getters") >= AWARD_MIN_VOTE_GETTERS)
+        )
+        configs["award_votes"].extend(award_seasons.select(*PARTITION_KEYS, "awardID").iter_rows())
+
+        team_counts = (
+            self.fielding_df
+            .filter(pl.col("lgID").is_in(PUZZLE_LEAGUES))
+            .group_by(PARTITION_KEYS)
+            .agg(pl.col("teamID").n_unique().alias("teams"))
+        )
+        for fielding_df, positions in (
+            (self.fielding_df, [p for p in POSITIONS if p not in OUTFIELD_POSITIONS]),
+            (self.fielding_of_split_df, OUTFIELD_POSITIONS),
+        ):
+            starters = (
+                fielding_df
+                .filter(pl.col("POS").is_in(positions))
+                .group_by([*PARTITION_KEYS, "POS"])
+                .agg(pl.col("teamID").n_unique().alias("starters"))
+                .join(team_counts, on=PARTITION_KEYS)
+                .filter(pl.col("starters") == pl.col("teams"))
+            )
+            configs["starters"].extend(starters.select(*PARTITION_KEYS, "POS").iter_rows())
+
+        index = {
+            puzzle_type: tuple(sorted((int(year), str(league), str(key)) for year, league, key in rows))
+            for puzzle_type, rows in configs.items()
+        }
+        logger.info(
+            "Indexed %d feasible puzzle configurations in %.0f ms",
+            sum(len(rows) for rows in index.values()), (time.perf_counter() - start) * 1000,
+        )
+        return index
+
+    def _get_player_names(self) -> dict[str, str | None]:
+        if self._player_names is None:
+            people_df = self._dataset("people_df")
+            with self._names_lock:
+                if self._player_names is None:
+                    self._player_names = _build_player_names(people_df)
+        return self._player_names
+
+    def _get_puzzle_table(self) -> dict[tuple[str, int, str, str], tuple[tuple, ...]]:
+        if self._puzzle_table is None:
+            with self._table_lock:
+                if self._puzzle_table is None:
+                    self._puzzle_table = self._build_puzzle_table()
+        return self._puzzle_table
 
-        self.batting_df = pl.read_csv(base_dir / "Batting.csv").filter(
-            pl.col("yearID").is_between(1947, 2024)
+    def _build_puzzle_table(self) -> dict[tuple[str, int, str, str], tuple[tuple, ...]]:
+        """
+        Precompute the player list of every puzzle configuration.
+        One vectorized group-by pass per stat/award/position family; each entry
+        is stored as a tuple of row tuples keyed by (puzzle_type, year, league, key).
+        """
+        start = time.perf_counter()
+        table = {}
+
+        for stat in BATTING_STATS:
+            self._materialize_leaderboards(table, "batting_stat", self.batting_df, stat, descending=True)
+        for stat in PITCHING_STATS:
+            pitching_df = self.pitching_df.filter(pl.col("IPouts") > ERA_MIN_IPOUTS) if stat == "ERA" else self.pitching_df
+            self._materialize_leaderboards(table, "pitching_stat", pitching_df, stat, descending=(stat != "ERA"))
+
+        award_lists = (
+            self.awards_df
+            .filter(pl.col("awardID").is_in(AWARDS))
+            .sort("pointsWon", descending=True, maintain_order=True)
+            .group_by([*PARTITION_KEYS, "awardID"], maintain_order=True)
+            .head(PUZZLE_TOP_N)
+            .group_by([*PARTITION_KEYS, "awardID"], maintain_order=True)
+            .agg(pl.col("playerID"))
         )
-        self.pitching_df = pl.read_csv(base_dir / "Pitching.csv").filter(
-            pl.col("yearID").is_between(1947, 2024)
+        for year, league, award, player_ids in award_lists.iter_rows():
+            table[("award_votes", year, league, award)] = tuple((name,) for name in self._names(player_ids))
+
+        infield = self.fielding_df.filter(pl.col("POS").is_in([p for p in POSITIONS if p not in OUTFIELD_POSITIONS]))
+        outfield = self.fielding_of_split_df.filter(pl.col("POS").is_in(OUTFIELD_POSITIONS))
+        for fielding_df in (infield, outfield):
+            starter_lists = (
+                fielding_df
+                .sort("GS", descending=True, maintain_order=True)
+                .group_by([*PARTITION_KEYS, "POS", "teamID"], maintain_order=True)
+                .head(1)
+                .group_by([*PARTITION_KEYS, "POS"], maintain_order=True)
+                .agg(pl.col("playerID"), platoon=pl.col("GS") < 90)
+            )
+            for year, league, position, player_ids, platoons in starter_lists.iter_rows():
+                table[("starters", year, league, position)] = tuple(zip(self._names(player_ids), platoons))
+
+        size_bytes = sum(
+            sys.getsizeof(rows) + sum(sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row) for row in rows)
+            for rows in table.values()
         )
-        self.people_df = pl.read_csv(base_dir / "People.csv")
-        self.awards_df = pl.read_csv(base_dir / "AwardsSharePlayers.csv").filter(
-            pl.col("yearID").is_between(1947, 2024)
+        logger.info(
+            "Materialized %d puzzle configurations in %.0f ms (~%.1f MiB)",
+            len(table), (time.perf_counter() - start) * 1000, size_bytes / 2**20,
         )
-        self.fielding_df = pl.read_csv(base_dir / "Fielding.csv").filter(
-            pl.col("yearID").is_between(1947, 2024)
+        return table
+
+    def _materialize_leaderboards(self, table: dict, puzzle_type: str, df: pl.DataFrame, stat: str, descending: bool) -> None:
+        """Add the top-N leaderboard of every season for one stat to the puzzle table."""
+        leader_lists = (
+            df
+            .sort(stat, descending=descending, maintain_order=True)
+            .group_by(PARTITION_KEYS, maintain_order=True)
+            .head(PUZZLE_TOP_N)
+            .group_by(PARTITION_KEYS, maintain_order=True)
+            .agg(pl.col("playerID"), pl.col(stat))
         )
-        self.fielding_of_split_df = pl.read_csv(base_dir / "FieldingOFsplit.csv").filter(
-            pl.col("yearID").is_between(1947, 2024)
+        for year, league, player_ids, values in leader_lists.iter_rows():
+            table[(puzzle_type, year, league, stat)] = tuple(zip(self._names(player_ids), values))
+
+    def _names(self, player_ids: Iterable[str]) -> list[str | None]:
+        """Resolve player IDs to full names through the player dimension."""
+        player_names = self._get_player_names()
+        return [player_names.get(player_id) for player_id in player_ids]
+
+    def _from_table(self, puzzle_type: str, year: int, league: str, key: str, top_n: int = PUZZLE_TOP_N) -> tuple[tuple, ...] | None:
+        """
+        Look up a materialized player list.
+        Returns None when the table is disabled or does not cover the request.
+        """
+        if not self.materialize or top_n != PUZZLE_TOP_N or key not in PUZZLE_KEYS[puzzle_type]:
+            return None
+        return self._get_puzzle_table().get((puzzle_type, year, league, key), ())
+
+    def _season(self, name: str, year: int, league: str) -> pl.DataFrame:
+        """
+        Return the rows of a single season and league as a zero-copy slice.
+        Unknown seasons yield an empty frame with the same schema.
+        """
+        df = self._dataset(name)
+        offset, length = self._season_indexes[name].get((year, league), (0, 0))
+        return df.slice(offset, length)
+
+    def get_players_for_configs(self, configs: list[tuple[str, int, str, str]]) -> list[list[dict]]:
+        """
+        Evaluate many puzzle configurations in one pass.
+        Configs are (puzzle_type, year, league, key) tuples, where key is the stat,
+        award or position. Configurations sharing a puzzle type and key become one
+        group-wise top-k query; all queries are collected together and names are
+        resolved once at the end.
+
+        Returns one player list per config, in input order, shaped like the
+        corresponding single-config method's result.
+        """
+        if self.materialize:
+            return [self._format_players(config[0], self._from_table(*config)) for config in configs]
+
+        seasons_by_query: dict[tuple[str, str], set[tuple[int, str]]] = {}
+        for puzzle_type, year, league, key in configs:
+            seasons_by_query.setdefault((puzzle_type, key), set()).add((year, league))
+
+        queries = list(seasons_by_query)
+        frames = pl.collect_all([
+            self._batch_query(puzzle_type, key, seasons_by_query[(puzzle_type, key)])
+            for puzzle_type, key in queries
+        ])
+
+        rows_by_config: dict[tuple[str, int, str, str], list[tuple]] = {}
+        for (puzzle_type, key), frame in zip(queries, frames):
+            for year, league, player_id, value in frame.iter_rows():
+                rows_by_config.setdefault((puzzle_type, year, league, key), []).append((player_id, value))
+
+        names = dict(zip(
+            (player_id for rows in rows_by_config.values() for player_id, _ in rows),
+            self._names(player_id for rows in rows_by_config.values() for player_id, _ in rows),
+        ))
+        return [
+            self._format_players(config[0], [(names[player_id], value) for player_id, value in rows_by_config.get(config, [])])
+            for config in configs
+        ]
+
+    def _batch_query(self, puzzle_type: str, key: str, seasons: set[tuple[int, str]]) -> pl.LazyFrame:
+        """
+        Build the lazy top-k query for one (puzzle_type, key) over a set of seasons.
+        Yields (yearID, lgID, playerID, value) rows, ranked within each season.
+        """
+        if puzzle_type == "starters":
+            name = "fielding_of_split_df" if key in OUTFIELD_POSITIONS else "fielding_df"
+        else:
+            name = {"batting_stat": "batting_df", "pitching_stat": "pitching_df", "award_votes": "awards_df"}[puzzle_type]
+
+        # Concatenated zero-copy season slices, so only the requested seasons are scanned
+        query = pl.concat([self._season(name, year, league) for year, league in sorted(seasons)]).lazy()
+
+        if puzzle_type == "batting_stat":
+            ranked = query.sort(key, descending=True, maintain_order=True)
+            value, group_keys, top_n = pl.col(key), PARTITION_KEYS, PUZZLE_TOP_N
+        elif puzzle_type == "pitching_stat":
+            if key == "ERA":
+                query = query.filter(pl.col("IPouts") > ERA_MIN_IPOUTS)
+            ranked = query.sort(key, descending=(key != "ERA"), maintain_order=True)
+            value, group_keys, top_n = pl.col(key), PARTITION_KEYS, PUZZLE_TOP_N
+        elif puzzle_type == "award_votes":
+            ranked = query.filter(pl.col("awardID") == key).sort("pointsWon", descending=True, maintain_order=True)
+            value, group_keys, top_n = pl.lit(None), PARTITION_KEYS, PUZZLE_TOP_N
+        else:
+            ranked = query.filter(pl.col("POS") == key).sort("GS", descending=True, maintain_order=True)
+            value, group_keys, top_n = pl.col("GS") < 90, [*PARTITION_KEYS, "teamID"], 1
+
+        return (
+            ranked
+            .group_by(group_keys, maintain_order=True)
+            .head(top_n)
+            .select(
+                pl.col("yearID").cast(pl.Int64),
+                pl.col("lgID").cast(pl.String),
+                pl.col("playerID").cast(pl.String),
+                value.alias("value"),
+            )
         )
-        self.teams_df = pl.read_csv(base_dir / "Teams.csv")
+
+    @staticmethod
+    def _format_players(puzzle_type: str, rows: Iterable[tuple]) -> list[dict]:
+        """
+        Shape (name, value) rows into a puzzle's player list.
+        Award lists are shuffled on every call and expose no values.
+        """
+        if puzzle_type == "award_votes":
+            names = [row[0] for row in rows]
+            return [{"name": name} for name in random.sample(names, len(names))]
+        if puzzle_type == "starters":
+            return [{"name": name, "platoon": platoon} for name, platoon in rows]
+        return [{"name": name, "value": value} for name, value in rows]
 
     def get_top_batting_leaders(self, year: int, league: str, stat: str, top_n: int = 10) -> list[dict]:
         """
@@ -35,19 +661,19 @@ class BaseballCSVDAO:
 
         Returns: [{"name": "Player Name", "value": 62.0}, ...]
         """
-        result = (
-            self.batting_df
-            .filter((pl.col("yearID") == year) & (pl.col("lgID") == league))
+        materialized = self._from_table("batting_stat", year, league, stat, top_n)
+        if materialized is not None:
+            return [{"name": name, "value": value} for name, value in materialized]
+
+        leaders = (
+            self._season("batting_df", year, league)
             .sort(stat, descending=True)
             .head(top_n)
-            .join(self.people_df, on="playerID", how="left")
-            .with_columns(
-                full_name=pl.concat_str([pl.col("nameFirst"), pl.col("nameLast")], separator=" ")
-            )
-            .select(["full_name", stat])
-            .rename({"full_name": "name", stat: "value"})
         )
-        return result.to_dicts()
+        return [
+            {"name": name, "value": value}
+            for name, value in zip(self._names(leaders["playerID"]), leaders[stat].to_list())
+        ]
 
     def get_top_pitching_leaders(self, year: int, league: str, stat: str, top_n: int = 10) -> list[dict]:
         """
@@ -57,28 +683,23 @@ class BaseballCSVDAO:
 
         Returns: [{"name": "Player Name", "value": 2.28}, ...]
         """
+        materialized = self._from_table("pitching_stat", year, league, stat, top_n)
+        if materialized is not None:
+            return [{"name": name, "value": value} for name, value in materialized]
+
         descending = (stat != "ERA")
 
-        # Apply minimum innings filter for ERA
-        filtered_df = self.pitching_df.filter(
-            (pl.col("yearID") == year) & (pl.col("lgID") == league)
-        )
+        filtered_df = self._season("pitching_df", year, league)
 
+        # Apply minimum innings filter for ERA
         if stat == "ERA":
-            filtered_df = filtered_df.filter(pl.col("IPouts") > 486)
+            filtered_df = filtered_df.filter(pl.col("IPouts") > ERA_MIN_IPOUTS)
 
-        result = (
-            filtered_df
-            .sort(stat, descending=descending)
-            .head(top_n)
-            .join(self.people_df, on="playerID", how="left")
-            .with_columns(
-                full_name=pl.concat_str([pl.col("nameFirst"), pl.col("nameLast")], separator=" ")
-            )
-            .select(["full_name", stat])
-            .rename({"full_name": "name", stat: "value"})
-        )
-        return result.to_dicts()
+        leaders = filtered_df.sort(stat, descending=descending).head(top_n)
+        return [
+            {"name": name, "value": value}
+            for name, value in zip(self._names(leaders["playerID"]), leaders[stat].to_list())
+        ]
 
     def get_award_vote_getters(self, year: int, league: str, award: str, top_n: int = 10) -> list[dict]:
         """
@@ -87,20 +708,18 @@ class BaseballCSVDAO:
 
         Returns: [{"name": "Player Name"}, ...]
         """
-        result = (
-            self.awards_df
-            .filter((pl.col("yearID") == year) & (pl.col("lgID") == league) & (pl.col("awardID") == award))
+        materialized = self._from_table("award_votes", year, league, award, top_n)
+        if materialized is not None:
+            return [{"name": name} for (name,) in random.sample(materialized, len(materialized))]
+
+        vote_getters = (
+            self._season("awards_df", year, league)
+            .filter(pl.col("awardID") == award)
             .sort("pointsWon", descending=True)
             .head(top_n)
-            .join(self.people_df, on="playerID", how="left")
-            .with_columns(
-                full_name=pl.concat_str([pl.col("nameFirst"), pl.col("nameLast")], separator=" ")
-            )
-            .select("full_name")
-            .rename({"full_name": "name"})
-            .sample(fraction=1.0, shuffle=True)
         )
-        return result.to_dicts()
+        names = self._names(vote_getters["playerID"])
+        return [{"name": name} for name in random.sample(names, len(names))]
 
     def get_starters_for_position(self, year: int, league: str, position: str) -> list[dict]:
         """
@@ -110,24 +729,25 @@ class BaseballCSVDAO:
 
         Returns: [{"name": "Player Name", "platoon": false}, ...]
         """
+        materialized = self._from_table("starters", year, league, position)
+        if materialized is not None:
+            return [{"name": name, "platoon": platoon} for name, platoon in materialized]
+
         # Choose the correct dataframe based on position
-        if position in ["LF", "CF", "RF"]:
-            source_df = self.fielding_of_split_df
+        if position in OUTFIELD_POSITIONS:
+            season_df = self._season("fielding_of_split_df", year, league)
         else:
-            source_df = self.fielding_df
+            season_df = self._season("fielding_df", year, league)
 
-        result = (
-            source_df
-            .filter((pl.col("yearID") == year) & (pl.col("lgID") == league) & (pl.col("POS") == position))
+        starters = (
+            season_df
+            .filter(pl.col("POS") == position)
             .sort("GS", descending=True)
             .group_by("teamID")
             .head(1)
-            .join(self.people_df, on="playerID", how="left")
-            .with_columns(
-                full_name=pl.concat_str([pl.col("nameFirst"), pl.col("nameLast")], separator=" "),
-                platoon=pl.col("GS") < 90
-            )
-            .select(["full_name", "platoon"])
-            .rename({"full_name": "name"})
+            .with_columns(platoon=pl.col("GS") < 90)
         )
-        return result.to_dicts()
+        return [
+            {"name": name, "platoon": platoon}
+            for name, platoon in zip(self._names(starters["playerID"]), starters["platoon"].to_list())
+        ]
@@ -1,10 +1,17 @@
+from contextlib import contextmanager
+from typing import Iterator
+from sqlalchemy import insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 from datetime import date, datetime
 
 from src.model.db.guessr_orm import GuessrORM, GuessrPuzzleORM
 
 
+# First key of the two-key advisory locks taken for guessr generation (ASCII "GSGR")
+GENERATION_LOCK_NAMESPACE = 0x47534752
+
+
 class GuessrDAO:
     """Data Access Object for Guessr and GuessrPuzzle entities."""
 
@@ -17,6 +24,30 @@ class GuessrDAO:
         """
         self.db = db
 
+    @contextmanager
+    def generation_lock(self, *puzzle_dates: date) -> Iterator[None]:
+        """
+        Run a block as one transaction holding the generation lock of one or more dates.
+
+        Takes a transaction-scoped Postgres advisory lock per date, so only one
+        session (in any process or instance) generates a date at a time. Several
+        dates are locked in one statement, in date order. Commits when the block
+        succeeds, which also releases the locks; rolls back otherwise.
+
+        Args:
+            puzzle_dates: Dates being generated
+        """
+        try:
+            self.db.execute(
+                text("SELECT pg_advisory_xact_lock(:namespace, key) FROM unnest(CAST(:keys AS integer[])) AS key"),
+                {"namespace": GENERATION_LOCK_NAMESPACE, "keys": sorted(d.toordinal() for d in puzzle_dates)},
+            )
+            yield
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
     def create_guessr(self, puzzle_date: date, created_at: datetime) -> GuessrORM:
         """
         Create a new guessr (daily puzzle set) for a given date.
@@ -36,6 +67,26 @@ class GuessrDAO:
         self.db.flush()  # Get the ID without committing
         return guessr
 
+    def create_guessrs(self, puzzle_dates: list[date], created_at: datetime) -> dict[date, int]:
+        """
+        Create the guessrs of many dates with a single INSERT ... RETURNING (for backfills).
+        Dates that already have a guessr are left untouched. Does not commit.
+
+        Args:
+            puzzle_dates: Dates to create guessrs for
+            created_at: Timestamp for creation
+
+        Returns:
+            Mapping of each newly created guessr's date to its ID
+        """
+        rows = self.db.execute(
+            pg_insert(GuessrORM)
+            .values([{"date": puzzle_date, "created_at": created_at} for puzzle_date in puzzle_dates])
+            .on_conflict_do_nothing(index_elements=[GuessrORM.date])
+            .returning(GuessrORM.date, GuessrORM.id)
+        ).all()
+        return dict(rows)
+
     def get_guessr_by_id(self, guessr_id: int) -> GuessrORM | None:
         """
         Get a guessr by its ID.
@@ -64,38 +115,70 @@ class GuessrDAO:
             .filter(GuessrORM.date == puzzle_date)\
             .first()
 
-    def get_all_guessrs(self) -> list[GuessrORM]:
+    def get_all_guessrs(self, end_date: date | None = None) -> list[GuessrORM]:
         """
         Get all guessrs ordered by date descending (newest first).
 
+        Args:
+            end_date: If given, only guessrs dated on or before it
+
         Returns:
-            List of all GuessrORM instances
+            List of GuessrORM instances
         """
-        return self.db.query(GuessrORM)\
-            .order_by(GuessrORM.date.desc())\
+        query = self.db.query(GuessrORM)
+        if end_date is not None:
+            query = query.filter(GuessrORM.date <= end_date)
+        return query.order_by(GuessrORM.date.desc()).all()
+
+    def get_guessr_dates_in_range(self, start_date: date, end_date: date) -> set[date]:
+        """
+        Get the dates that have a guessr within a date range.
+
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            Set of dates
+        """
+        rows = self.db.query(GuessrORM.date)\
+            .filter(GuessrORM.date >= start_date)\
+            .filter(GuessrORM.date <= end_date)\
             .all()
+        return {puzzle_date for (puzzle_date,) in rows}
 
-    def create_puzzle(self, puzzle: GuessrPuzzleORM) -> GuessrPuzzleORM:
+    def create_puzzles(self, puzzles: list[GuessrPuzzleORM]) -> list[GuessrPuzzleORM]:
         """
-        Create a new puzzle for a guessr.
+        Create puzzles (of one or more guessrs) with a single INSERT ... RETURNING.
+        Does not commit; generation_lock commits the guessrs and their puzzles together.
 
         Args:
-            puzzle: GuessrPuzzleORM instance to create
+            puzzles: New GuessrPuzzleORM instances (without IDs)
 
         Returns:
-            GuessrPuzzleORM: The created puzzle
+            List of created GuessrPuzzleORM with their IDs, in input order
 
         Raises:
             IntegrityError: If unique constraint violated
         """
-        try:
-            self.db.add(puzzle)
-            self.db.commit()
-            self.db.refresh(puzzle)
-            return puzzle
-        except IntegrityError:
-            self.db.rollback()
-            raise
+        columns = [column.key for column in GuessrPuzzleORM.__table__.columns if column.key != "id"]
+        rows = [{column: getattr(puzzle, column) for column in columns} for puzzle in puzzles]
+        return self.db.scalars(
+            insert(GuessrPuzzleORM).returning(GuessrPuzzleORM, sort_by_parameter_order=True),
+            rows,
+        ).all()
+
+    def delete_puzzles(self, guessr_id: int) -> None:
+        """
+        Delete all puzzles of a guessr (used to regenerate an incomplete guessr).
+
+        Args:
+            guessr_id: Integer ID of the guessr
+        """
+        self.db.query(GuessrPuzzleORM)\
+            .filter(GuessrPuzzleORM.guessr_id == guessr_id)\
+            .delete()
+        self.db.flush()
 
     def get_puzzles_by_guessr_id(self, guessr_id: int) -> list[GuessrPuzzleORM]:
         """
@@ -112,35 +195,38 @@ class GuessrDAO:
             .order_by(GuessrPuzzleORM.puzzle_number)\
             .all()
 
-    def get_puzzle_by_guessr_and_number(self, guessr_id: int, puzzle_number: int) -> GuessrPuzzleORM | None:
+    def get_puzzles_with_dates_in_range(self, start_date: date, end_date: date) -> list[tuple[int, date, GuessrPuzzleORM]]:
         """
-        Get a specific puzzle by guessr ID and puzzle number.
-        Used for race condition handling.
+        Get every puzzle within a date range with its guessr's ID and date, in one query
+        (for exporting many guessrs at once).
 
         Args:
-            guessr_id: Integer ID of the guessr
-            puzzle_number: Puzzle number (0, 1, or 2)
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
 
         Returns:
-            GuessrPuzzleORM if found, None otherwise
+            List of (guessr_id, date, GuessrPuzzleORM) tuples ordered by date, then puzzle_number
         """
-        return self.db.query(GuessrPuzzleORM)\
-            .filter(GuessrPuzzleORM.guessr_id == guessr_id)\
-            .filter(GuessrPuzzleORM.puzzle_number == puzzle_number)\
-            .first()
+        return self.db.query(GuessrORM.id, GuessrORM.date, GuessrPuzzleORM)\
+            .join(GuessrORM)\
+            .filter(GuessrORM.date >= start_date)\
+            .filter(GuessrORM.date <= end_date)\
+            .order_by(GuessrORM.date, GuessrPuzzleORM.puzzle_number)\
+            .all()
 
-    def get_puzzles_in_date_range(self, start_date: date, end_date: date) -> list[GuessrPuzzleORM]:
+    def get_puzzle_configs_in_date_range(self, start_date: date, end_date: date) -> list[tuple[date, str, int, dict]]:
         """
-        Get all puzzles within a date range (for 365-day uniqueness check).
+        Get the date, type, answer and config of every puzzle within a date range
+        (for the 365-day uniqueness check). Reads only those columns, without loading ORM objects.
 
         Args:
             start_date: Start of date range (inclusive)
             end_date: End of date range (inclusive)
 
         Returns:
-            List of GuessrPuzzleORM instances
+            List of (date, puzzle_type, answer, config) tuples
         """
-        return self.db.query(GuessrPuzzleORM)\
+        return self.db.query(GuessrORM.date, GuessrPuzzleORM.puzzle_type, GuessrPuzzleORM.answer, GuessrPuzzleORM.config)\
             .join(GuessrORM)\
             .filter(GuessrORM.date >= start_date)\
             .filter(GuessrORM.date <= end_date)\
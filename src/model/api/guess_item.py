@@ -1,5 +1,7 @@
 from pydantic import BaseModel, field_validator
 
+from src.model.baseball_manifest import get_active_manifest
+
 
 class GuessItem(BaseModel):
     """
@@ -17,6 +19,7 @@ class GuessItem(BaseModel):
 
     @field_validator('year')
     def validate_year_range(cls, v):
-        if v < 1947 or v > 2024:
-            raise ValueError('Year must be between 1947 and 2024')
+        manifest = get_active_manifest()
+        if v < manifest.min_year or v > manifest.max_year:
+            raise ValueError(f'Year must be between {manifest.min_year} and {manifest.max_year}')
         return v
@@ -0,0 +1,49 @@
+from pathlib import Path
+import hashlib
+import json
+from pydantic import BaseModel
+
+
+class BaseballManifest(BaseModel):
+    """
+    Describes one release of the baseball CSV dataset.
+    Lives next to the CSVs as manifest.json; bump version (and max_year for a
+    new season) whenever the CSVs change, so cached puzzles are invalidated.
+
+    files maps each CSV name to its sha256. It is optional and filled in by
+    `python -m src.command.update_baseball_manifest`.
+    """
+    version: str
+    min_year: int
+    max_year: int
+    files: dict[str, str] = {}
+
+    @classmethod
+    def load(cls, base_dir: Path) -> "BaseballManifest":
+        return cls.model_validate_json((base_dir / "manifest.json").read_text(encoding="utf-8"))
+
+    def write(self, base_dir: Path) -> None:
+        (base_dir / "manifest.json").write_text(json.dumps(self.model_dump(), indent=2) + "\n", encoding="utf-8")
+
+
+DEFAULT_BASE_DIR = Path(__file__).parent.parent / "static" / "baseball"
+
+_active_manifest: BaseballManifest | None = None
+
+
+def get_active_manifest() -> BaseballManifest:
+    """Manifest of the dataset currently being served (read from disk until one is set)."""
+    global _active_manifest
+    if _active_manifest is None:
+        _active_manifest = BaseballManifest.load(DEFAULT_BASE_DIR)
+    return _active_manifest
+
+
+def set_active_manifest(manifest: BaseballManifest) -> None:
+    global _active_manifest
+    _active_manifest = manifest
+
+
+def file_sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
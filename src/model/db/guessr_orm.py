@@ -32,6 +32,8 @@ class GuessrPuzzleORM(Base):
     puzzle_type = Column(String, nullable=False)
     answer = Column(Integer, nullable=False)
     config = Column(JSONB, nullable=False)
+    # Player list rendered at generation time; NULL only for rows not yet backfilled
+    players = Column(JSONB, nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False)
 
     guessr = relationship("GuessrORM", back_populates="puzzles")
@@ -0,0 +1,47 @@
+from datetime import date
+from pathlib import Path
+import gzip
+from pydantic import BaseModel
+
+CATALOG_FORMAT_VERSION = 1
+
+
+class PlannedPuzzle(BaseModel):
+    """One puzzle chosen for a date, with its rendered player list, before it is stored."""
+    puzzle_number: int
+    puzzle_type: str
+    answer: int
+    config: dict
+    players: list[dict]
+
+
+class GuessrCatalog(BaseModel):
+    """
+    Precomputed puzzles of upcoming dates, written by
+    `python -m src.command.export_guessr_catalog`. GuessrService stores a
+    date's puzzles from the catalog instead of generating them.
+
+    The selections depend on the baseball data, so the catalog only applies
+    while dataset_version is the one being served. Stored as gzip-compressed
+    JSON; bump CATALOG_FORMAT_VERSION when the layout changes.
+    """
+    format_version: int = CATALOG_FORMAT_VERSION
+    dataset_version: str
+    days: dict[date, list[PlannedPuzzle]]
+
+    @classmethod
+    def load(cls, path: Path) -> "GuessrCatalog":
+        catalog = cls.model_validate_json(gzip.decompress(path.read_bytes()))
+        if catalog.format_version != CATALOG_FORMAT_VERSION:
+            raise ValueError(f"{path} has catalog format {catalog.format_version}, expected {CATALOG_FORMAT_VERSION}")
+        return catalog
+
+    def write(self, path: Path) -> None:
+        # mtime=0 keeps the file byte-identical for identical schedules
+        path.write_bytes(gzip.compress(self.model_dump_json().encode(), mtime=0))
+
+    def puzzles_for(self, puzzle_date: date, dataset_version: str) -> list[PlannedPuzzle] | None:
+        """The planned puzzles of a date, or None if the catalog does not cover it for this dataset."""
+        if dataset_version != self.dataset_version:
+            return None
+        return self.days.get(puzzle_date)
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+import hashlib
+
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True, slots=True)
+class SerializedView:
+    """
+    A response model rendered once to its final JSON bytes, with a strong ETag
+    derived from those bytes. Routers return it directly, skipping response_model
+    validation and serialization.
+    """
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "SerializedView":
+        body = model.model_dump_json().encode()
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.config.dependency import get_baseball_dataset_manager, get_guessr_service
+from src.service.guessr_service import GuessrService
+from src.util.auth import verify_api_key
+from src.util.baseball_dataset_manager import BaseballDatasetManager
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(verify_api_key)])
+
+
+@router.post("/baseball/reload", status_code=status.HTTP_202_ACCEPTED)
+async def reload_baseball_dataset(
+    manager: BaseballDatasetManager = Depends(get_baseball_dataset_manager)
+):
+    """
+    Reload the baseball dataset from disk in the background.
+    Requires the X-API-Key header.
+    The current dataset keeps serving until the new one is fully loaded.
+    """
+    if not manager.reload_in_background():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A dataset reload is already in progress."
+        )
+
+    return {"status": "reloading", "current_version": manager.get_dao().dataset_version}
+
+
+@router.get("/guessr/flights")
+async def get_guessr_flight_stats(service: GuessrService = Depends(get_guessr_service)):
+    """
+    Request coalescing metrics for guessr puzzle loads in this process.
+    waiters counts requests that shared another request's DB read / generation.
+    """
+    return service.get_flight_stats()
@@ -1,9 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Request, Response
 from datetime import date, datetime, timedelta
-from zoneinfo import ZoneInfo
 
 from src.config.dependency import get_guessr_service, get_content_service
-from src.service.guessr_service import GuessrService
+from src.service.guessr_service import GuessrService, PUZZLE_TIMEZONE
 from src.service.content_service import ContentService
 from src.model.view.guessr_list_view import GuessrListView
 from src.model.view.guessr_item_view import GuessrItemView
@@ -29,8 +28,7 @@ def _validate_date_not_future(puzzle_date: date) -> None:
     """
     Validate that the requested date is not in the future.
     """
-    eastern = ZoneInfo("America/New_York")
-    current_date_et = datetime.now(eastern).date()
+    current_date_et = datetime.now(PUZZLE_TIMEZONE).date()
 
     if puzzle_date > current_date_et:
         raise HTTPException(
@@ -39,8 +37,19 @@ def _validate_date_not_future(puzzle_date: date) -> None:
         )
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison, per RFC 9110).
+    """
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/", response_model=GuessrListView)
-async def get_puzzles(
+def get_puzzles(
+    request: Request,
     date: date = Query(..., description="Date in YYYY-MM-DD format"),
     service: GuessrService = Depends(get_guessr_service)
 ):
@@ -49,9 +58,17 @@ async def get_puzzles(
     Public endpoint - no authentication required.
     Only prevents requesting future dates.
     Returns guessr ID which can be used for POST validation.
+    Sync so it runs in the threadpool: concurrent first requests for a date
+    block on one shared generation without stalling the event loop.
+    Serves pre-serialized JSON with an ETag; a matching If-None-Match gets 304.
     """
     _validate_date_not_future(date)
-    return service.get_puzzles_for_date(date)
+    serialized = service.get_serialized_puzzles(date)
+    headers = {"ETag": serialized.etag}
+
+    if _etag_matches(request.headers.get("if-none-match"), serialized.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=serialized.body, media_type="application/json", headers=headers)
 
 
 @router.post("/{guessr_id}", response_model=BatchGuessValidationView)
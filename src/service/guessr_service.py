@@ -1,17 +1,41 @@
 from expiringdict import ExpiringDict
 from datetime import date, datetime, UTC, timedelta
+from typing import Callable
+from zoneinfo import ZoneInfo
 import random
-from sqlalchemy.exc import IntegrityError
+import zlib
 
 from src.dao.guessr_dao import GuessrDAO
 from src.dao.baseball_csv_dao import BaseballCSVDAO
 from src.model.view.guessr_puzzle_view import GuessrPuzzleView
 from src.model.view.guessr_list_view import GuessrListView
+from src.model.view.serialized_view import SerializedView
 from src.model.view.guessr_item_view import GuessrItemView
 from src.model.view.guess_validation_view import GuessValidationView
 from src.model.view.batch_guess_validation_view import BatchGuessValidationView
 from src.model.api.guess_item import GuessItem
 from src.model.db.guessr_orm import GuessrORM, GuessrPuzzleORM
+from src.model.guessr_catalog import GuessrCatalog, PlannedPuzzle
+from src.util.single_flight import SingleFlight
+from src.util.tiered_cache import CacheBackend, TieredCache
+from src.util.used_config_index import UsedConfigIndex
+
+# A new guessr date starts at midnight in this timezone
+PUZZLE_TIMEZONE = ZoneInfo("America/New_York")
+
+
+def create_guessr_cache(l2: CacheBackend | None = None) -> TieredCache[GuessrListView]:
+    """
+    Cache of complete guessr responses: an in-process LRU, optionally backed by
+    a shared L2 holding them as zlib-compressed JSON.
+    """
+    return TieredCache(
+        max_len=365,
+        ttl_seconds=86400,
+        encode=lambda view: zlib.compress(view.model_dump_json().encode()),
+        decode=lambda data: GuessrListView.model_validate_json(zlib.decompress(data)),
+        l2=l2,
+    )
 
 
 class GuessrService:
@@ -20,115 +44,332 @@ class GuessrService:
     Handles puzzle generation, caching, and validation.
     """
 
-    _cache = ExpiringDict(max_len=365 * 3, max_age_seconds=86400)
-
-    def __init__(self, guessr_dao: GuessrDAO, baseball_dao: BaseballCSVDAO):
+    # Default (in-process only) guessr cache; the app passes one with a shared L2 when configured
+    _cache = create_guessr_cache()
+    # Final JSON bytes of each cached GuessrListView, under the same keys
+    _response_cache = ExpiringDict(max_len=365, max_age_seconds=86400)
+    # guessr_id -> (date, {puzzle_number: answer}) for guess validation; answers never change
+    _answer_keys = ExpiringDict(max_len=4096, max_age_seconds=30 * 86400)
+    # Configs used per date over the past year, maintained as days are generated
+    _used_configs = UsedConfigIndex(window_days=365)
+    # Coalesces concurrent cache misses for the same date into one DB read / generation
+    _flights = SingleFlight("guessr")
+
+    # Name of the config field holding each puzzle type's stat/award/position
+    CONFIG_KEYS = {
+        "batting_stat": "stat",
+        "pitching_stat": "stat",
+        "award_votes": "award",
+        "starters": "position",
+    }
+
+    def __init__(
+        self,
+        guessr_dao: GuessrDAO,
+        baseball_dao: BaseballCSVDAO,
+        catalog: GuessrCatalog | None = None,
+        cache: TieredCache[GuessrListView] | None = None,
+    ):
         self.guessr_dao = guessr_dao
         self.baseball_dao = baseball_dao
+        self.catalog = catalog
+        if cache is not None:
+            self._cache = cache
 
-    @staticmethod
-    def _get_league_for_award(award: str, year: int) -> str:
+    def get_puzzles_for_date(self, puzzle_date: date) -> GuessrListView:
+        """
+        Get 3 puzzles for a specific date.
+        Flow: Cache → DB → Generate
+        Returns guessr ID along with puzzles.
+        The cache holds the complete response, so a hit never touches the database.
+        Concurrent misses for a date share a single DB read / generation.
+        """
+        # Check cache
+        cached = self._get_from_cache(puzzle_date)
+        if cached:
+            return cached
+
+        return self._flights.do(self._cache_key(puzzle_date), lambda: self._load_or_generate(puzzle_date))
+
+    def get_serialized_puzzles(self, puzzle_date: date) -> SerializedView:
         """
-        Determine the correct league identifier for an award based on year.
-        Some awards were given as "ML" (Major League) before they split into AL/NL.
+        Get the puzzles for a date as ready-to-send JSON bytes with an ETag.
+        A date's puzzles never change once generated, so the bytes are rendered once and reused.
+        """
+        cache_key = self._cache_key(puzzle_date)
+        serialized = self._response_cache.get(cache_key)
+        if serialized is None:
+            serialized = SerializedView.from_model(self.get_puzzles_for_date(puzzle_date))
+            self._response_cache[cache_key] = serialized
+        return serialized
+
+    def get_flight_stats(self) -> dict[str, int]:
+        """Coalescing metrics for puzzle loads (see SingleFlight.stats)."""
+        return self._flights.stats()
+
+    def plan_guessrs(
+        self,
+        puzzle_dates: list[date],
+        fetch_players: Callable[[list[tuple[str, int, str, str]]], list[list[dict]]] | None = None,
+    ) -> dict[date, list[PlannedPuzzle]]:
+        """
+        Choose the puzzles of many dates without storing them (backfills, catalog export).
 
-        Args:
-            award: The award name
-            year: The year of the award
+        Configurations are chosen date by date in order, exactly as on-demand
+        generation would, each date excluding the configs of its past year
+        including those planned earlier in the call. Planned configs are kept
+        local to the call; callers record the dates they actually store. Player
+        lists for every date come from one fetch_players call
+        (BaseballCSVDAO.get_players_for_configs unless given).
 
         Returns:
-            "ML" if the award was combined that year, "AL" or "NL" otherwise
+            Mapping of each date (in order) to its 3 planned puzzles
         """
-        if award == "Cy Young Award" and year < 1967:
-            return "ML"
-        elif award == "Rookie of the Year" and year < 1949:
-            return "ML"
-        else:
-            # Return None to indicate we should use the randomly selected league
-            return None
+        fetch_players = fetch_players or self.baseball_dao.get_players_for_configs
+
+        # Step 1: Pick each date's configs in order, excluding the stored and planned configs of its past year
+        selections_by_date = {}
+        planned_configs: dict[date, set[tuple[str, int, str, str]]] = {}
+        for puzzle_date in puzzle_dates:
+            window_start = puzzle_date - timedelta(days=365)
+            used_configs = self._get_used_configs(start_date=window_start, end_date=puzzle_date - timedelta(days=1))
+            for planned_date, configs in planned_configs.items():
+                if window_start <= planned_date < puzzle_date:
+                    used_configs |= configs
+            selections = self._select_puzzle_configs(puzzle_date, used_configs)
+            planned_configs[puzzle_date] = {
+                self._dao_config(puzzle_type, answer, config)
+                for _, puzzle_type, answer, config in selections
+            }
+            selections_by_date[puzzle_date] = selections
+
+        # Step 2: Fetch the player lists of every date at once
+        players = iter(fetch_players([
+            self._dao_config(puzzle_type, answer, config)
+            for selections in selections_by_date.values()
+            for _, puzzle_type, answer, config in selections
+        ]))
+        return {
+            puzzle_date: [
+                PlannedPuzzle(
+                    puzzle_number=puzzle_number,
+                    puzzle_type=puzzle_type,
+                    answer=answer,
+                    config=config,
+                    players=next(players)
+                )
+                for puzzle_number, puzzle_type, answer, config in selections
+            ]
+            for puzzle_date, selections in selections_by_date.items()
+        }
+
+    def backfill_guessrs(
+        self,
+        start_date: date,
+        end_date: date,
+        batch_days: int = 100,
+        fetch_players: Callable[[list[tuple[str, int, str, str]]], list[list[dict]]] | None = None,
+    ) -> list[date]:
+        """
+        Generate and store the guessr of every date from start_date to end_date
+        (inclusive) that does not have one yet, in bulk.
 
-    def get_puzzles_for_date(self, puzzle_date: date) -> GuessrListView:
+        Puzzles are chosen by plan_guessrs. Each batch of batch_days dates is then
+        written as one transaction holding their generation locks: one INSERT for
+        the guessrs and one for their puzzles. Dates generated concurrently by the
+        app are skipped.
+
+        Only past and current dates (in PUZZLE_TIMEZONE) can be backfilled; upcoming
+        guessrs are pre-generated through the catalog instead.
+
+        Returns:
+            The dates written, in order
         """
-        Get 3 puzzles for a specific date.
-        Flow: Cache → DB → Generate
-        Returns guessr ID along with puzzles.
+        today = datetime.now(PUZZLE_TIMEZONE).date()
+        if end_date > today:
+            raise ValueError(f"Cannot backfill guessrs after today ({today}); got end date {end_date}")
+
+        existing = self.guessr_dao.get_guessr_dates_in_range(start_date, end_date)
+        puzzle_dates = [
+            puzzle_date
+            for puzzle_date in (start_date + timedelta(days=n) for n in range((end_date - start_date).days + 1))
+            if puzzle_date not in existing
+        ]
+        planned = self.plan_guessrs(puzzle_dates, fetch_players)
+
+        written = []
+        for i in range(0, len(puzzle_dates), batch_days):
+            batch = puzzle_dates[i:i + batch_days]
+            created_at = datetime.now(UTC)
+            with self.guessr_dao.generation_lock(*batch):
+                guessr_ids = self.guessr_dao.create_guessrs(batch, created_at)
+                puzzles = [
+                    self._to_orm(guessr_ids[puzzle_date], puzzle, created_at)
+                    for puzzle_date in batch if puzzle_date in guessr_ids
+                    for puzzle in planned[puzzle_date]
+                ]
+                if puzzles:
+                    self.guessr_dao.create_puzzles(puzzles)
+            for puzzle_date in batch:
+                if puzzle_date in guessr_ids:
+                    self._used_configs.add(puzzle_date, [
+                        self._dao_config(puzzle.puzzle_type, puzzle.answer, puzzle.config)
+                        for puzzle in planned[puzzle_date]
+                    ])
+                    written.append(puzzle_date)
+
+        return written
+
+    def _load_or_generate(self, puzzle_date: date) -> GuessrListView:
         """
-        # Check cache
+        Load the guessr for a date from the DB, generating it if it does not exist,
+        and cache the result.
+
+        Generation runs under a per-date Postgres advisory lock, so across all
+        instances exactly one generates a date; the others wait for its commit
+        and return the winner's puzzles. Dates covered by the catalog are stored
+        from it rather than generated.
+        """
+        # Another flight may have filled the cache since our miss
         cached = self._get_from_cache(puzzle_date)
         if cached:
-            guessr = self.guessr_dao.get_guessr_by_date(puzzle_date)
-            if guessr:
-                return GuessrListView(id=guessr.id, date=str(puzzle_date), puzzles=cached)
+            return cached
 
         # Check DB
+        guessr_view = self._load_from_db(puzzle_date)
+        if guessr_view is None:
+            with self.guessr_dao.generation_lock(puzzle_date):
+                # Another instance may have generated the date while we waited for the lock
+                guessr_view = self._load_from_db(puzzle_date)
+                if guessr_view is None:
+                    planned = self.catalog.puzzles_for(puzzle_date, self.baseball_dao.dataset_version) if self.catalog else None
+                    if planned:
+                        guessr, puzzles_view = self._store_guessr(puzzle_date, planned)
+                    else:
+                        guessr, puzzles_view = self._generate_and_store_guessr(puzzle_date)
+                    guessr_view = GuessrListView(id=guessr.id, date=str(puzzle_date), puzzles=puzzles_view)
+
+        self._put_in_cache(puzzle_date, guessr_view)
+        return guessr_view
+
+    def _load_from_db(self, puzzle_date: date) -> GuessrListView | None:
+        """
+        Read a date's complete guessr (all 3 puzzles) from the DB.
+        Returns None if it has not been generated.
+        """
         guessr = self.guessr_dao.get_guessr_by_date(puzzle_date)
         if guessr:
             puzzles_orm = self.guessr_dao.get_puzzles_by_guessr_id(guessr.id)
             if len(puzzles_orm) == 3:
-                puzzles_view = self._transform_to_views(puzzles_orm)
-                self._put_in_cache(puzzle_date, puzzles_view)
-                return GuessrListView(id=guessr.id, date=str(puzzle_date), puzzles=puzzles_view)
-
-        # Generate
-        guessr, puzzles_view = self._generate_and_store_guessr(puzzle_date)
-        self._put_in_cache(puzzle_date, puzzles_view)
-        return GuessrListView(id=guessr.id, date=str(puzzle_date), puzzles=puzzles_view)
+                self._put_answer_key(guessr.id, puzzle_date, puzzles_orm)
+                return GuessrListView(id=guessr.id, date=str(puzzle_date), puzzles=self._transform_to_views(puzzles_orm))
+        return None
 
     def validate_guesses(self, guessr_id: int, guesses: list[GuessItem]) -> BatchGuessValidationView:
         """
         Batch validation of multiple guesses for a guessr.
-        Much simpler with two-table design!
+        Answers come from the answer-key cache, so warm validations never touch the database.
+        Guessrs of future dates (pre-generated ahead of midnight) are treated as missing,
+        so their answers cannot be read early.
         """
-        # Step 1: Get guessr
-        guessr = self.guessr_dao.get_guessr_by_id(guessr_id)
-        if not guessr:
+        # Step 1: Get the guessr's answer key (puzzle_number -> answer)
+        puzzle_date, answer_key = self._get_answer_key(guessr_id)
+        if puzzle_date > datetime.now(PUZZLE_TIMEZONE).date():
             raise ValueError(f"Guessr {guessr_id} not found")
 
-        # Step 2: Get all puzzles for this guessr
-        puzzles = self.guessr_dao.get_puzzles_by_guessr_id(guessr_id)
-        if len(puzzles) != 3:
-            raise ValueError(f"Expected 3 puzzles for guessr {guessr_id}, found {len(puzzles)}")
-
-        # Step 3: Map by puzzle_number
-        puzzle_map = {puzzle.puzzle_number: puzzle for puzzle in puzzles}
-
-        # Step 4: Validate guess IDs
+        # Step 2: Validate guess IDs
         for guess in guesses:
-            if guess.id not in puzzle_map:
+            if guess.id not in answer_key:
                 raise ValueError(f"Invalid puzzle_number {guess.id} for guessr {guessr_id}")
 
-        # Step 5: Validate and score
-        results = [self._validate_single_guess(guess, puzzle_map[guess.id]) for guess in guesses]
+        # Step 3: Validate and score
+        results = [self._validate_single_guess(guess, answer_key[guess.id]) for guess in guesses]
 
         total_score = sum(result.score for result in results)
         overall_score = total_score + 1
 
         return BatchGuessValidationView(results=results, overall_score=overall_score)
 
+    def _get_answer_key(self, guessr_id: int) -> tuple[date, dict[int, int]]:
+        """
+        Get a guessr's date and puzzle_number -> answer mapping, loading them on first lookup.
+        Answers never change once generated, so entries are only evicted for space.
+
+        Raises:
+            ValueError: If the guessr does not exist or does not have 3 puzzles
+        """
+        answer_key = self._answer_keys.get(guessr_id)
+        if answer_key is not None:
+            return answer_key
+
+        guessr = self.guessr_dao.get_guessr_by_id(guessr_id)
+        if not guessr:
+            raise ValueError(f"Guessr {guessr_id} not found")
+
+        puzzles = self.guessr_dao.get_puzzles_by_guessr_id(guessr_id)
+        if len(puzzles) != 3:
+            raise ValueError(f"Expected 3 puzzles for guessr {guessr_id}, found {len(puzzles)}")
+
+        return self._put_answer_key(guessr_id, guessr.date, puzzles)
+
+    def _put_answer_key(self, guessr_id: int, puzzle_date: date, puzzles: list[GuessrPuzzleORM]) -> tuple[date, dict[int, int]]:
+        entry = (puzzle_date, {puzzle.puzzle_number: puzzle.answer for puzzle in puzzles})
+        self._answer_keys[guessr_id] = entry
+        return entry
+
     def get_all_guessrs(self) -> list[GuessrItemView]:
         """
         Get all available guessrs ordered by date (newest first).
+        Guessrs pre-generated for future dates are not listed until their day (US Eastern).
 
         Returns:
             List of GuessrItemView with id and date for each guessr
         """
-        guessrs = self.guessr_dao.get_all_guessrs()
+        guessrs = self.guessr_dao.get_all_guessrs(end_date=datetime.now(PUZZLE_TIMEZONE).date())
         return [
             GuessrItemView(id=guessr.id, date=str(guessr.date))
             for guessr in guessrs
         ]
 
-    def _validate_single_guess(self, guess: GuessItem, puzzle: GuessrPuzzleORM) -> GuessValidationView:
+    def get_stored_guessrs(self, puzzle_dates: list[date]) -> list[GuessrListView]:
+        """
+        Read the complete guessrs of many dates in one query, bypassing the caches
+        (for the static snapshot export). Dates without a complete guessr are left out.
+
+        Returns:
+            GuessrListView per stored date, in date order
+        """
+        if not puzzle_dates:
+            return []
+        wanted = set(puzzle_dates)
+        rows = [
+            (guessr_id, puzzle_date, puzzle)
+            for guessr_id, puzzle_date, puzzle in self.guessr_dao.get_puzzles_with_dates_in_range(min(wanted), max(wanted))
+            if puzzle_date in wanted
+        ]
+        puzzles_by_guessr: dict[tuple[int, date], list[GuessrPuzzleORM]] = {}
+        for guessr_id, puzzle_date, puzzle in rows:
+            puzzles_by_guessr.setdefault((guessr_id, puzzle_date), []).append(puzzle)
+        complete = {key: puzzles for key, puzzles in puzzles_by_guessr.items() if len(puzzles) == 3}
+
+        # One transform for every guessr, so rows without stored players share one DAO call
+        views = iter(self._transform_to_views([puzzle for puzzles in complete.values() for puzzle in puzzles]))
+        return [
+            GuessrListView(id=guessr_id, date=str(puzzle_date), puzzles=[next(views) for _ in range(3)])
+            for guessr_id, puzzle_date in complete
+        ]
+
+    def _validate_single_guess(self, guess: GuessItem, answer: int) -> GuessValidationView:
         """
-        Private method to validate a single guess against a puzzle.
+        Private method to validate a single guess against a puzzle's answer.
         Calculates score using exponential decay formula.
         """
-        score = self._calculate_score(puzzle.answer, guess.year)
+        score = self._calculate_score(answer, guess.year)
 
         return GuessValidationView(
             id=guess.id,
-            valid=(puzzle.answer == guess.year),
-            correct_answer=puzzle.answer,
+            valid=(answer == guess.year),
+            correct_answer=answer,
             score=score
         )
 
@@ -160,152 +401,177 @@ class GuessrService:
     def _generate_and_store_guessr(self, puzzle_date: date) -> tuple[GuessrORM, list[GuessrPuzzleView]]:
         """
         Generate and store a complete guessr (1 guessr + 3 puzzles).
+        Must run inside GuessrDAO.generation_lock, which commits the rows together.
         Returns the guessr and view representations of puzzles.
         """
-        # Step 1: Create guessr
-        guessr = self.guessr_dao.create_guessr(puzzle_date, datetime.now(UTC))
-
-        # Step 2: Check for duplicate configs in past 365 days
-        past_puzzles = self.guessr_dao.get_puzzles_in_date_range(
+        # Step 1: Check for duplicate configs in past 365 days
+        used_configs = self._get_used_configs(
             start_date=puzzle_date - timedelta(days=365),
             end_date=puzzle_date - timedelta(days=1)
         )
 
-        used_configs = set()
-        for puzzle in past_puzzles:
-            config_key = puzzle.config.get('stat') or puzzle.config.get('award') or puzzle.config.get('position')
-            used_configs.add((
-                puzzle.puzzle_type,
-                puzzle.config['league'],
-                config_key,
-                puzzle.answer
-            ))
+        # Step 2: Pick 3 unused configurations
+        selections = self._select_puzzle_configs(puzzle_date, used_configs)
 
-        seed = int(puzzle_date.strftime("%Y%m%d"))
-        rng = random.Random(seed)
+        # Step 3: Fetch all three player lists in one batched DAO call
+        players_by_puzzle = self.baseball_dao.get_players_for_configs([
+            self._dao_config(puzzle_type, answer, config)
+            for _, puzzle_type, answer, config in selections
+        ])
 
-        puzzle_views = []
-        for puzzle_number in range(3):
-            for attempt in range(100):
-                puzzle_type = rng.choice(["batting_stat", "pitching_stat", "award_votes", "starters"])
-                answer = rng.randint(1947, 2024)
-                league = rng.choice(["AL", "NL"])
-
-                if puzzle_type == "batting_stat":
-                    stat = rng.choice(["HR", "RBI", "H", "SB"])
-                    config_key = stat
-                    config = {"league": league, "stat": stat}
-                elif puzzle_type == "pitching_stat":
-                    stat = rng.choice(["W", "SO", "ERA", "SV"])
-                    config_key = stat
-                    config = {"league": league, "stat": stat}
-                elif puzzle_type == "award_votes":
-                    award = rng.choice(["Most Valuable Player", "Cy Young Award", "Rookie of the Year"])
-                    config_key = award
-                    # Use ML for awards that weren't split into AL/NL yet
-                    award_league = self._get_league_for_award(award, answer)
-                    if award_league:
-                        config = {"league": award_league, "award": award}
-                    else:
-                        config = {"league": league, "award": award}
-                else:
-                    position = rng.choice(["C", "1B", "2B", "3B", "SS", "LF", "CF", "RF"])
-                    config_key = position
-                    config = {"league": league, "position": position}
-
-                config_tuple = (puzzle_type, league, config_key, answer)
-                if config_tuple not in used_configs:
-                    break
-
-            if puzzle_type == "batting_stat":
-                players = self.baseball_dao.get_top_batting_leaders(answer, config["league"], config["stat"], 10)
-            elif puzzle_type == "pitching_stat":
-                players = self.baseball_dao.get_top_pitching_leaders(answer, config["league"], config["stat"], 10)
-            elif puzzle_type == "award_votes":
-                players = self.baseball_dao.get_award_vote_getters(answer, config["league"], config["award"], 10)
-            else:
-                players = self.baseball_dao.get_starters_for_position(answer, config["league"], config["position"])
-
-            puzzle_orm = GuessrPuzzleORM(
-                guessr_id=guessr.id,
-                puzzle_number=puzzle_number,
-                puzzle_type=puzzle_type,
-                answer=answer,
-                config=config,
-                created_at=datetime.now(UTC)
-            )
+        # Step 4: Store them
+        return self._store_guessr(puzzle_date, [
+            PlannedPuzzle(puzzle_number=puzzle_number, puzzle_type=puzzle_type, answer=answer, config=config, players=players)
+            for (puzzle_number, puzzle_type, answer, config), players in zip(selections, players_by_puzzle)
+        ])
+
+    def _store_guessr(self, puzzle_date: date, planned: list[PlannedPuzzle]) -> tuple[GuessrORM, list[GuessrPuzzleView]]:
+        """
+        Write a date's guessr and its planned puzzles, reusing a guessr left
+        without its puzzles by an earlier failure, then all 3 puzzles in one INSERT.
+        Must run inside GuessrDAO.generation_lock, which commits the rows together.
+        Returns the guessr and view representations of puzzles.
+        """
+        guessr = self.guessr_dao.get_guessr_by_date(puzzle_date)
+        if guessr:
+            self.guessr_dao.delete_puzzles(guessr.id)
+        else:
+            guessr = self.guessr_dao.create_guessr(puzzle_date, datetime.now(UTC))
 
-            try:
-                created_puzzle = self.guessr_dao.create_puzzle(puzzle_orm)
-            except IntegrityError:
-                created_puzzle = self.guessr_dao.get_puzzle_by_guessr_and_number(guessr.id, puzzle_number)
-                if not created_puzzle:
-                    raise RuntimeError(f"Race condition: puzzle should exist but not found")
+        created_at = datetime.now(UTC)
+        created_puzzles = self.guessr_dao.create_puzzles([
+            self._to_orm(guessr.id, puzzle, created_at) for puzzle in planned
+        ])
 
-            puzzle_view = GuessrPuzzleView(
+        puzzle_views = [
+            GuessrPuzzleView(
                 id=created_puzzle.puzzle_number,
                 puzzle_type=created_puzzle.puzzle_type,
                 hints=created_puzzle.config,
-                players=players
+                players=created_puzzle.players
             )
-            puzzle_views.append(puzzle_view)
+            for created_puzzle in created_puzzles
+        ]
+
+        self._used_configs.add(puzzle_date, [
+            self._dao_config(puzzle.puzzle_type, puzzle.answer, puzzle.config)
+            for puzzle in planned
+        ])
 
+        # Guessr ids come from a sequence and are never reused, so an entry for a
+        # generation that is later rolled back is simply never looked up
+        self._put_answer_key(guessr.id, puzzle_date, created_puzzles)
         return guessr, puzzle_views
 
+    @staticmethod
+    def _to_orm(guessr_id: int, puzzle: PlannedPuzzle, created_at: datetime) -> GuessrPuzzleORM:
+        return GuessrPuzzleORM(
+            guessr_id=guessr_id,
+            puzzle_number=puzzle.puzzle_number,
+            puzzle_type=puzzle.puzzle_type,
+            answer=puzzle.answer,
+            config=puzzle.config,
+            players=puzzle.players,
+            created_at=created_at
+        )
+
+    def _get_used_configs(self, start_date: date, end_date: date) -> set[tuple[str, int, str, str]]:
+        """
+        Configs used between start_date and end_date (inclusive), as (puzzle_type, year, league, key).
+        Served from the rolling index; only dates it has not loaded yet (after a
+        restart, or days generated elsewhere since) are queried.
+        """
+        missing = self._used_configs.missing_range(start_date, end_date)
+        if missing:
+            self._used_configs.load(*missing, [
+                (puzzle_date, self._dao_config(puzzle_type, answer, config))
+                for puzzle_date, puzzle_type, answer, config in self.guessr_dao.get_puzzle_configs_in_date_range(*missing)
+            ])
+        return self._used_configs.configs_between(start_date, end_date)
+
+    def _select_puzzle_configs(
+        self, puzzle_date: date, used_configs: set[tuple[str, int, str, str]]
+    ) -> list[tuple[int, str, int, dict]]:
+        """
+        Choose 3 distinct puzzle configurations not used in the past year.
+
+        Candidates are the DAO's feasible configurations minus used_configs
+        (as (puzzle_type, year, league, key) tuples). Each puzzle draws a type
+        among those with candidates left, then one candidate of that type, from
+        an rng seeded by the date, so a date always yields the same puzzles.
+
+        Returns:
+            List of (puzzle_number, puzzle_type, answer, config)
+
+        Raises:
+            RuntimeError: If every feasible configuration has been used
+        """
+        rng = random.Random(int(puzzle_date.strftime("%Y%m%d")))
+        feasible_configs = self.baseball_dao.get_feasible_configs()
+        candidates = {
+            puzzle_type: [config for config in configs if (puzzle_type, *config) not in used_configs]
+            for puzzle_type, configs in sorted(feasible_configs.items())
+        }
+
+        selections = []
+        for puzzle_number in range(3):
+            puzzle_types = [puzzle_type for puzzle_type, configs in candidates.items() if configs]
+            if not puzzle_types:
+                raise RuntimeError(f"No unused puzzle configurations left for {puzzle_date}")
+
+            puzzle_type = rng.choice(puzzle_types)
+            configs = candidates[puzzle_type]
+            answer, league, config_key = configs.pop(rng.randrange(len(configs)))
+            config = {"league": league, self.CONFIG_KEYS[puzzle_type]: config_key}
+            selections.append((puzzle_number, puzzle_type, answer, config))
+
+        return selections
+
     def _transform_to_views(self, puzzles_orm: list[GuessrPuzzleORM]) -> list[GuessrPuzzleView]:
         """
         Transform ORM puzzles to view models.
-        Fetches player data from CSV DAO based on config.
+        Player lists come from the puzzle rows; only rows stored before they held
+        players fall back to one batched CSV DAO call.
         """
-        views = []
-        for orm in puzzles_orm:
-            config = orm.config
-            answer = orm.answer
-            puzzle_type = orm.puzzle_type
+        missing = [orm for orm in puzzles_orm if orm.players is None]
+        fetched = iter(self.baseball_dao.get_players_for_configs([
+            self._dao_config(orm.puzzle_type, orm.answer, orm.config)
+            for orm in missing
+        ]) if missing else [])
 
-            if puzzle_type == "batting_stat":
-                players = self.baseball_dao.get_top_batting_leaders(
-                    answer, config["league"], config["stat"], 10
-                )
-            elif puzzle_type == "pitching_stat":
-                players = self.baseball_dao.get_top_pitching_leaders(
-                    answer, config["league"], config["stat"], 10
-                )
-            elif puzzle_type == "award_votes":
-                players = self.baseball_dao.get_award_vote_getters(
-                    answer, config["league"], config["award"], 10
-                )
-            else:
-                players = self.baseball_dao.get_starters_for_position(
-                    answer, config["league"], config["position"]
-                )
-
-            views.append(GuessrPuzzleView(
+        return [
+            GuessrPuzzleView(
                 id=orm.puzzle_number,
                 puzzle_type=orm.puzzle_type,
-                hints=config,
-                players=players
-            ))
-        return views
+                hints=orm.config,
+                players=orm.players if orm.players is not None else next(fetched)
+            )
+            for orm in puzzles_orm
+        ]
 
-    def _get_from_cache(self, puzzle_date: date) -> list[GuessrPuzzleView] | None:
+    @staticmethod
+    def _dao_config(puzzle_type: str, answer: int, config: dict) -> tuple[str, int, str, str]:
         """
-        Check cache for all 3 puzzles.
-        Returns None if any puzzle is missing from cache.
+        Convert a stored puzzle config to the (puzzle_type, year, league, key)
+        tuple understood by BaseballCSVDAO.get_players_for_configs.
         """
-        puzzles = []
-        for puzzle_number in range(3):
-            cache_key = f"puzzle:{puzzle_date}:{puzzle_number}"
-            cached = self._cache.get(cache_key)
-            if cached is None:
-                return None
-            puzzles.append(cached)
-        return puzzles
+        key = config.get("stat") or config.get("award") or config.get("position")
+        return (puzzle_type, answer, config["league"], key)
+
+    def _cache_key(self, puzzle_date: date) -> str:
+        """Cache keys include the dataset version, so a dataset reload invalidates them."""
+        return f"guessr:{self.baseball_dao.dataset_version}:{puzzle_date}"
+
+    def _get_from_cache(self, puzzle_date: date) -> GuessrListView | None:
+        """
+        Check cache for the guessr of a date (id, date and all 3 puzzles),
+        in process first, then in the shared cache if there is one.
+        Returns None on a miss.
+        """
+        return self._cache.get(self._cache_key(puzzle_date))
 
-    def _put_in_cache(self, puzzle_date: date, puzzles: list[GuessrPuzzleView]):
+    def _put_in_cache(self, puzzle_date: date, guessr_view: GuessrListView):
         """
-        Store all 3 puzzles in cache with 24-hour TTL.
+        Store the complete guessr response in cache with 24-hour TTL.
         """
-        for puzzle_number, puzzle_view in enumerate(puzzles):
-            cache_key = f"puzzle:{puzzle_date}:{puzzle_number}"
-            self._cache[cache_key] = puzzle_view
+        self._cache.set(self._cache_key(puzzle_date), guessr_view)
@@ -1,5 +1,6 @@
+import secrets
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHeader
 from google.oauth2 import id_token
 from google.auth.transport import requests
 
@@ -9,6 +10,7 @@ from src.model.view.user_view import UserView
 from src.service.user_service import UserService
 
 security = HTTPBearer()
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
 def verify_google_token(
@@ -71,3 +73,21 @@ def get_current_user(
     picture = token_payload.get("picture", "")
 
     return user_service.authenticate_user(google_id, email, name, picture)
+
+
+def verify_api_key(
+    api_key: str | None = Depends(api_key_header),
+    settings: Settings = Depends(get_settings),
+) -> None:
+    """
+    Verifies the X-API-Key header against the configured API_KEY.
+    Used for operator-only endpoints; always rejects when no API_KEY is configured.
+
+    Raises:
+        HTTPException: If the key is missing or invalid
+    """
+    if not settings.api_key or not api_key or not secrets.compare_digest(api_key, settings.api_key):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key",
+        )
@@ -0,0 +1,103 @@
+from typing import Callable
+import logging
+import threading
+
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+from src.model.baseball_manifest import set_active_manifest
+
+logger = logging.getLogger(__name__)
+
+
+class BaseballDatasetManager:
+    """
+    Owns the BaseballCSVDAO currently being served and hot-swaps it when the
+    dataset changes (new season CSVs plus a bumped manifest.json).
+
+    A reload builds and fully warms the new DAO before swapping it in with a
+    single reference assignment. Requests resolve the DAO once, at dependency
+    injection, so in-flight requests keep using the DAO they started with.
+    """
+
+    def __init__(self, dao_factory: Callable[[], BaseballCSVDAO]):
+        """
+        Initialize the manager and create (but not load) the first DAO.
+
+        Args:
+            dao_factory: Builds a new, unloaded BaseballCSVDAO
+        """
+        self._dao_factory = dao_factory
+        self._reload_lock = threading.Lock()
+        self._stop_watching = threading.Event()
+        self._dao = dao_factory()
+        set_active_manifest(self._dao.manifest)
+
+    def get_dao(self) -> BaseballCSVDAO:
+        return self._dao
+
+    def reload(self) -> BaseballCSVDAO:
+        """
+        Build and warm a DAO from the files on disk, then swap it in.
+
+        Returns:
+            BaseballCSVDAO: The newly active DAO
+        """
+        with self._reload_lock:
+            return self._reload()
+
+    def reload_in_background(self) -> bool:
+        """
+        Start a reload on a background thread.
+
+        Returns:
+            bool: False if a reload is already running
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+
+        def run():
+            try:
+                self._reload()
+            except Exception:
+                logger.exception("Baseball dataset reload failed; still serving %s", self._dao.dataset_version)
+            finally:
+                self._reload_lock.release()
+
+        threading.Thread(target=run, name="baseball-reload", daemon=True).start()
+        return True
+
+    def start_watching(self, interval_seconds: float) -> threading.Thread:
+        """
+        Poll the active manifest.json and reload when it changes.
+        Update the CSVs first and the manifest last, since the manifest write triggers the reload.
+        """
+        def watch():
+            last_mtime = self._manifest_mtime()
+            while not self._stop_watching.wait(interval_seconds):
+                mtime = self._manifest_mtime()
+                if mtime != last_mtime:
+                    last_mtime = mtime
+                    logger.info("Baseball manifest changed; reloading dataset")
+                    self.reload_in_background()
+
+        self._stop_watching.clear()
+        thread = threading.Thread(target=watch, name="baseball-manifest-watch", daemon=True)
+        thread.start()
+        return thread
+
+    def stop_watching(self) -> None:
+        self._stop_watching.set()
+
+    def _reload(self) -> BaseballCSVDAO:
+        previous = self._dao
+        dao = self._dao_factory()
+        dao.warm_up()
+        self._dao = dao
+        set_active_manifest(dao.manifest)
+        logger.info("Baseball dataset swapped: %s -> %s", previous.dataset_version, dao.dataset_version)
+        return dao
+
+    def _manifest_mtime(self) -> int | None:
+        try:
+            return (self._dao.base_dir / "manifest.json").stat().st_mtime_ns
+        except OSError:
+            return None
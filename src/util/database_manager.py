@@ -1,6 +1,7 @@
+from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Generator, Iterator
 
 
 class DatabaseManager:
@@ -47,6 +48,18 @@ class DatabaseManager:
         Get a database session (for use with FastAPI Depends).
         Automatically closes the session after use.
 
+        Yields:
+            Session: A database session that is automatically closed
+        """
+        with self.session_scope() as session:
+            yield session
+
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        Provide a session for work outside a request (background jobs, commands).
+        Uncommitted work is rolled back when the session closes.
+
         Yields:
             Session: A database session that is automatically closed
         """
@@ -0,0 +1,106 @@
+from datetime import date, datetime, time, timedelta
+from typing import Callable
+import logging
+import threading
+
+from src.dao.guessr_dao import GuessrDAO
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+from src.model.guessr_catalog import GuessrCatalog
+from src.model.view.guessr_list_view import GuessrListView
+from src.service.guessr_service import GuessrService, PUZZLE_TIMEZONE
+from src.util.database_manager import DatabaseManager
+from src.util.tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+class GuessrScheduler:
+    """
+    Background thread that generates and caches each day's guessr ahead of
+    the midnight (US Eastern) rollover, so no request pays for generation.
+
+    Every instance runs one. Generation itself is serialized across instances
+    by GuessrDAO.generation_lock: one instance generates the date and the rest
+    wait for its commit and read the result, which also warms their caches.
+    Tomorrow is only prepared inside the lead window, never at startup. Until its
+    day it is only cached: the router refuses future dates, the summary does not
+    list it and its answers cannot be validated.
+    """
+
+    RETRY_SECONDS = 60
+
+    def __init__(
+        self,
+        database_manager: DatabaseManager,
+        baseball_dao_provider: Callable[[], BaseballCSVDAO],
+        lead_time: timedelta,
+        catalog: GuessrCatalog | None = None,
+        cache: TieredCache[GuessrListView] | None = None,
+    ):
+        """
+        Args:
+            database_manager: Source of sessions for the background work
+            baseball_dao_provider: Returns the active CSV DAO (it may be hot-swapped)
+            lead_time: How long before midnight ET to prepare the next date
+            catalog: Precomputed puzzles to store instead of generating (see GuessrCatalog)
+            cache: Guessr cache to warm (GuessrService's default if None)
+        """
+        self.database_manager = database_manager
+        self.baseball_dao_provider = baseball_dao_provider
+        self.lead_time = lead_time
+        self.catalog = catalog
+        self.cache = cache
+        self._stop = threading.Event()
+
+    def start(self) -> threading.Thread:
+        """Run the schedule on a daemon thread until stop() is called."""
+        self._stop.clear()
+        thread = threading.Thread(target=self._run, name="guessr-scheduler", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run_once(self, now: datetime | None = None) -> list[date]:
+        """
+        Make sure today's guessr exists and is cached, and tomorrow's too once
+        within lead_time of midnight ET. Tomorrow is never stored earlier, so a
+        start at any other time of day does not create a future guessr.
+
+        Returns:
+            The dates prepared
+        """
+        now = (now or datetime.now(PUZZLE_TIMEZONE)).astimezone(PUZZLE_TIMEZONE)
+        today = now.date()
+        dates = [today]
+        if self._next_midnight(now) - now <= self.lead_time:
+            dates.append(today + timedelta(days=1))
+        with self.database_manager.session_scope() as session:
+            service = GuessrService(GuessrDAO(session), self.baseball_dao_provider(), self.catalog, self.cache)
+            for puzzle_date in dates:
+                service.get_serialized_puzzles(puzzle_date)
+        logger.info("Guessrs ready for %s", ", ".join(str(puzzle_date) for puzzle_date in dates))
+        return dates
+
+    def seconds_until_next_run(self, now: datetime | None = None) -> float:
+        """Seconds until lead_time before the next midnight ET."""
+        now = (now or datetime.now(PUZZLE_TIMEZONE)).astimezone(PUZZLE_TIMEZONE)
+        next_run = self._next_midnight(now) - self.lead_time
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return (next_run - now).total_seconds()
+
+    @staticmethod
+    def _next_midnight(now: datetime) -> datetime:
+        return datetime.combine(now.date() + timedelta(days=1), time(), PUZZLE_TIMEZONE)
+
+    def _run(self) -> None:
+        wait_seconds = 0.0
+        while not self._stop.wait(wait_seconds):
+            try:
+                self.run_once()
+                wait_seconds = self.seconds_until_next_run()
+            except Exception:
+                logger.exception("Guessr pre-generation failed; retrying in %ds", self.RETRY_SECONDS)
+                wait_seconds = self.RETRY_SECONDS
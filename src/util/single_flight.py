@@ -0,0 +1,76 @@
+from concurrent.futures import Future
+from typing import Callable, TypeVar
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Flight:
+    def __init__(self):
+        self.future = Future()
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    In-process request coalescing: concurrent calls for the same key share one execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight block until it finishes and receive the same result (or exception).
+    Once a flight finishes, the next call for that key starts a new one.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._stats = {"flights": 0, "waiters": 0, "max_waiters": 0}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run fn for key, or wait for the call already running for key.
+
+        Args:
+            key: Identifies the work being coalesced
+            fn: Computes the result; only runs on the leading caller
+
+        Returns:
+            The result of the flight's single fn call
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight:
+                flight.waiters += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                leader = True
+
+        if leader:
+            try:
+                flight.future.set_result(fn())
+            except BaseException as e:
+                flight.future.set_exception(e)
+            finally:
+                self._land(key, flight)
+        return flight.future.result()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Totals since startup: completed flights, callers that waited on another
+        caller's flight instead of running their own, and the most waiters one flight absorbed.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _land(self, key: str, flight: _Flight) -> None:
+        with self._lock:
+            del self._flights[key]
+            self._stats["flights"] += 1
+            self._stats["waiters"] += flight.waiters
+            self._stats["max_waiters"] = max(self._stats["max_waiters"], flight.waiters)
+        if flight.waiters:
+            logger.info("%s flight %s absorbed %d waiting callers", self.name, key, flight.waiters)
@@ -0,0 +1,216 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Generic, Protocol, TypeVar
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+
+class CacheBackend(Protocol):
+    """Shared byte store behind a TieredCache (L2)."""
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """CacheBackend kept in a dict, for tests and single-process setups."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, bytes]] = {}
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_seconds, value)
+
+
+class RedisCacheBackend:
+    """
+    CacheBackend on any server speaking the Redis protocol (Redis, Valkey, Memorystore).
+    Short socket timeouts keep a slow or unreachable server from stalling requests.
+    """
+
+    def __init__(self, url: str, timeout_seconds: float = 0.25):
+        import redis  # Only needed when a shared cache is configured
+
+        self._client = redis.Redis.from_url(
+            url,
+            socket_timeout=timeout_seconds,
+            socket_connect_timeout=timeout_seconds,
+        )
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self._client.set(key, value, ex=ttl_seconds)
+
+
+class SqliteCacheBackend:
+    """
+    CacheBackend in a SQLite file on the instance's local disk. Entries survive
+    restarts, and every worker process on the host opening the same file shares
+    them (WAL mode lets readers proceed during a write).
+
+    Expiry uses wall-clock time, since it is compared across processes.
+    Expired rows are purged when the file is opened.
+    """
+
+    # Workers starting together may all set up the file at once; wait longer than a lookup would
+    SETUP_TIMEOUT_SECONDS = 10
+
+    def __init__(self, path: Path, busy_timeout_seconds: float = 0.25):
+        self.path = path
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._local = threading.local()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, timeout=self.SETUP_TIMEOUT_SECONDS, isolation_level=None)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entry ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            connection.execute("DELETE FROM cache_entry WHERE expires_at <= ?", (time.time(),))
+        finally:
+            connection.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        """One autocommit connection per thread (sqlite3 connections are not shared across threads)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout_seconds, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> bytes | None:
+        row = self._connection().execute(
+            "SELECT value FROM cache_entry WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO cache_entry (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl_seconds),
+        )
+
+
+class TieredCache(Generic[V]):
+    """
+    In-process LRU (L1) in front of an optional shared CacheBackend (L2), so
+    instances and workers reuse each other's entries instead of each warming
+    their own.
+
+    Reads try L1, then L2 (filling L1 on a hit); writes go to both. L2 holds
+    values as bytes produced by encode / read back by decode. Entries expire
+    after ttl_seconds in either tier.
+
+    L2 is best effort: when a call fails the cache logs it and runs on L1 alone
+    for L2_RETRY_SECONDS, so an outage costs one timeout rather than one per
+    request. Entries L2 cannot decode are treated as misses.
+    """
+
+    L2_RETRY_SECONDS = 30
+
+    def __init__(
+        self,
+        max_len: int,
+        ttl_seconds: int,
+        encode: Callable[[V], bytes],
+        decode: Callable[[bytes], V],
+        l2: CacheBackend | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_len = max_len
+        self.ttl_seconds = ttl_seconds
+        self.encode = encode
+        self.decode = decode
+        self.l2 = l2
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._l2_down_until = 0.0
+
+    def get(self, key: str) -> V | None:
+        value = self._get_local(key)
+        if value is not None or not self._l2_available():
+            return value
+
+        try:
+            data = self.l2.get(key)
+        except Exception:
+            self._mark_l2_down("get")
+            return None
+        if data is None:
+            return None
+
+        try:
+            value = self.decode(data)
+        except Exception:
+            logger.warning("Ignoring undecodable shared cache entry %s", key, exc_info=True)
+            return None
+        self._put_local(key, value)
+        return value
+
+    def set(self, key: str, value: V) -> None:
+        self._put_local(key, value)
+        if self._l2_available():
+            try:
+                self.l2.set(key, self.encode(value), self.ttl_seconds)
+            except Exception:
+                self._mark_l2_down("set")
+
+    def clear(self) -> None:
+        """Empty L1 (L2 is shared and left alone)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _get_local(self, key: str) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _put_local(self, key: str, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_len:
+                self._entries.popitem(last=False)
+
+    def _l2_available(self) -> bool:
+        return self.l2 is not None and self._clock() >= self._l2_down_until
+
+    def _mark_l2_down(self, operation: str) -> None:
+        self._l2_down_until = self._clock() + self.L2_RETRY_SECONDS
+        logger.warning(
+            "Shared cache %s failed; using the in-process cache only for %ds",
+            operation, self.L2_RETRY_SECONDS, exc_info=True,
+        )
@@ -0,0 +1,95 @@
+from datetime import date, timedelta
+from typing import Iterable
+import threading
+
+UsedConfig = tuple[str, int, str, str]
+
+
+class UsedConfigIndex:
+    """
+    Rolling in-memory index of the puzzle configurations used per date, so
+    generation can exclude the past year's configs without a range query.
+
+    The index tracks the contiguous date range it has loaded from the database
+    (its coverage). missing_range() reports the part of a window it cannot
+    answer, which the caller loads once with load(); dates generated in this
+    process are recorded with add(). Dates older than window_days before the
+    newest known date are expired.
+
+    The index is per process: a past date that did not exist when its range
+    was loaded, and is generated later by another instance, is not seen until
+    the process restarts. The 365-day rule is a variety goal, so the rare
+    repeat this allows is accepted.
+    """
+
+    def __init__(self, window_days: int = 365):
+        self.window_days = window_days
+        self._lock = threading.Lock()
+        self._by_date: dict[date, frozenset[UsedConfig]] = {}
+        self._coverage: tuple[date, date] | None = None
+
+    def missing_range(self, start: date, end: date) -> tuple[date, date] | None:
+        """
+        The part of [start, end] that has not been loaded, or None if the window is covered.
+        """
+        with self._lock:
+            if self._coverage is None:
+                return start, end
+            covered_start, covered_end = self._coverage
+            if start < covered_start or covered_end < start - timedelta(days=1):
+                return start, end
+            if covered_end >= end:
+                return None
+            return covered_end + timedelta(days=1), end
+
+    def load(self, start: date, end: date, configs: Iterable[tuple[date, UsedConfig]]) -> None:
+        """
+        Record every config used between start and end (inclusive), as read from the database.
+        Extends the coverage when the range adjoins it, otherwise replaces it.
+        """
+        loaded: dict[date, set[UsedConfig]] = {}
+        for puzzle_date, config in configs:
+            loaded.setdefault(puzzle_date, set()).add(config)
+
+        with self._lock:
+            if self._coverage and self._coverage[0] <= start <= self._coverage[1] + timedelta(days=1):
+                self._coverage = (self._coverage[0], max(end, self._coverage[1]))
+            else:
+                self._coverage = (start, end)
+                self._by_date = {d: c for d, c in self._by_date.items() if start <= d <= end}
+            self._by_date.update((d, frozenset(c)) for d, c in loaded.items())
+            self._expire()
+
+    def add(self, puzzle_date: date, configs: Iterable[UsedConfig]) -> None:
+        """
+        Record the configs of a date generated by this process.
+        A date right after the coverage extends it, so daily generation never queries.
+        """
+        with self._lock:
+            self._by_date[puzzle_date] = frozenset(configs)
+            if self._coverage and self._coverage[1] + timedelta(days=1) == puzzle_date:
+                self._coverage = (self._coverage[0], puzzle_date)
+            self._expire()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_date = {}
+            self._coverage = None
+
+    def configs_between(self, start: date, end: date) -> set[UsedConfig]:
+        """All configs used between start and end (inclusive)."""
+        with self._lock:
+            return {
+                config
+                for puzzle_date, configs in self._by_date.items()
+                if start <= puzzle_date <= end
+                for config in configs
+            }
+
+    def _expire(self) -> None:
+        if not self._by_date:
+            return
+        cutoff = max(self._by_date) - timedelta(days=self.window_days + 1)
+        self._by_date = {d: c for d, c in self._by_date.items() if d >= cutoff}
+        if self._coverage and self._coverage[0] < cutoff:
+            self._coverage = (min(cutoff, self._coverage[1]), self._coverage[1])
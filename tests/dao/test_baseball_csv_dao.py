@@ -0,0 +1,313 @@
+from unittest.mock import patch
+import threading
+import polars as pl
+import pytest
+
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+
+CSV_FILES = {
+    "People.csv": (
+        "playerID,nameFirst,nameLast\n"
+        "ruthba01,Babe,Ruth\n"
+        "mayswi01,Willie,Mays\n"
+        "koufasa01,Sandy,Koufax\n"
+        "gibsobo01,Bob,Gibson\n"
+    ),
+    "Batting.csv": (
+        "playerID,yearID,stint,teamID,lgID,HR,RBI,H,SB\n"
+        "mayswi01,1965,1,SFN,NL,52,112,177,9\n"
+        "ruthba01,1965,1,NYA,AL,40,100,150,2\n"
+        "gibsobo01,1965,1,SLN,NL,5,20,30,0\n"
+        "mayswi01,1966,1,SFN,NL,37,103,159,5\n"
+    ),
+    "Pitching.csv": (
+        "playerID,yearID,stint,teamID,lgID,W,SO,ERA,SV,IPouts\n"
+        "koufasa01,1965,1,LAN,NL,26,382,2.04,2,1008\n"
+        "gibsobo01,1965,1,SLN,NL,20,270,3.07,1,900\n"
+        "mayswi01,1965,1,SFN,NL,0,1,0.00,0,3\n"
+    ),
+    "AwardsSharePlayers.csv": (
+        "awardID,yearID,lgID,playerID,pointsWon,pointsMax,votesFirst\n"
+        "Most Valuable Player,1965,NL,mayswi01,224,280,9\n"
+        "Most Valuable Player,1965,NL,koufasa01,177,280,6\n"
+        "Most Valuable Player,1965,NL,gibsobo01,20,280,0\n"
+        "Cy Young Award,1965,ML,koufasa01,20,20,20\n"
+    ),
+    "Fielding.csv": (
+        "playerID,yearID,stint,teamID,lgID,POS,G,GS\n"
+        "gibsobo01,1965,1,SLN,NL,SS,150,140\n"
+        "koufasa01,1965,1,SLN,NL,SS,20,10\n"
+        "ruthba01,1965,1,LAN,NL,SS,100,80\n"
+    ),
+    "FieldingOFsplit.csv": (
+        "playerID,yearID,stint,teamID,lgID,POS,G,GS\n"
+        "mayswi01,1965,1,SFN,NL,CF,157,155\n"
+    ),
+    "manifest.json": '{"version": "test", "min_year": 1947, "max_year": 2024}',
+    "Teams.csv": "yearID,lgID,teamID,name\n1965,NL,SFN,San Francisco Giants\n",
+}
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    base_dir = tmp_path / "csv"
+    base_dir.mkdir()
+    for name, content in CSV_FILES.items():
+        (base_dir / name).write_text(content)
+    return base_dir
+
+
+@pytest.fixture
+def dao(csv_dir):
+    return BaseballCSVDAO(base_dir=csv_dir)
+
+
+class TestBaseballCSVDAO:
+    def test_top_batting_leaders_only_reads_requested_season(self, dao):
+        result = dao.get_top_batting_leaders(1965, "NL", "HR", top_n=10)
+        assert result == [
+            {"name": "Willie Mays", "value": 52},
+            {"name": "Bob Gibson", "value": 5},
+        ]
+
+    def test_top_pitching_leaders_era_requires_qualifying_innings(self, dao):
+        result = dao.get_top_pitching_leaders(1965, "NL", "ERA", top_n=10)
+        assert [row["name"] for row in result] == ["Sandy Koufax", "Bob Gibson"]
+
+    def test_award_vote_getters_for_combined_league(self, dao):
+        result = dao.get_award_vote_getters(1965, "ML", "Cy Young Award", top_n=10)
+        assert result == [{"name": "Sandy Koufax"}]
+
+    def test_starters_pick_top_gs_per_team(self, dao):
+        result = dao.get_starters_for_position(1965, "NL", "SS")
+        assert sorted(result, key=lambda row: row["name"]) == [
+            {"name": "Babe Ruth", "platoon": True},
+            {"name": "Bob Gibson", "platoon": False},
+        ]
+
+    def test_starters_use_outfield_split(self, dao):
+        result = dao.get_starters_for_position(1965, "NL", "CF")
+        assert result == [{"name": "Willie Mays", "platoon": False}]
+
+    def test_starters_with_blank_games_started_have_unknown_platoon(self, csv_dir):
+        with open(csv_dir / "Fielding.csv", "a") as fielding:
+            fielding.write("mayswi01,1965,1,SFN,NL,C,120,\n")
+        dao = BaseballCSVDAO(base_dir=csv_dir)
+
+        assert dao.get_starters_for_position(1965, "NL", "C") == [{"name": "Willie Mays", "platoon": None}]
+        materialized = BaseballCSVDAO(base_dir=csv_dir, materialize=True)
+        assert materialized.get_starters_for_position(1965, "NL", "C") == [{"name": "Willie Mays", "platoon": None}]
+
+    def test_unknown_season_returns_empty(self, dao):
+        assert dao.get_top_batting_leaders(1950, "AL", "HR") == []
+        assert dao.get_starters_for_position(2030, "NL", "C") == []
+
+
+class TestBaseballCSVDAOBatch:
+    CONFIGS = [
+        ("batting_stat", 1965, "NL", "HR"),
+        ("pitching_stat", 1965, "NL", "ERA"),
+        ("award_votes", 1965, "NL", "Most Valuable Player"),
+        ("starters", 1965, "NL", "SS"),
+        ("starters", 1965, "NL", "CF"),
+        ("batting_stat", 1950, "AL", "HR"),
+    ]
+
+    @pytest.mark.parametrize("materialize", [False, True])
+    def test_batch_matches_single_config_queries(self, csv_dir, materialize):
+        dao = BaseballCSVDAO(base_dir=csv_dir, materialize=materialize)
+
+        batting, era, mvp, shortstops, center_fielders, empty = dao.get_players_for_configs(self.CONFIGS)
+
+        assert batting == dao.get_top_batting_leaders(1965, "NL", "HR")
+        assert era == dao.get_top_pitching_leaders(1965, "NL", "ERA")
+        assert sorted(mvp, key=str) == sorted(dao.get_award_vote_getters(1965, "NL", "Most Valuable Player"), key=str)
+        assert sorted(shortstops, key=str) == sorted(dao.get_starters_for_position(1965, "NL", "SS"), key=str)
+        assert center_fielders == [{"name": "Willie Mays", "platoon": False}]
+        assert empty == []
+
+
+class TestBaseballCSVDAOLazyLoading:
+    def test_construction_reads_no_csv(self, csv_dir):
+        with patch("src.dao.baseball_csv_dao.pl.read_csv", side_effect=AssertionError("CSV parsed")):
+            dao = BaseballCSVDAO(base_dir=csv_dir)
+        assert dao.frame_sizes() == {}
+
+    def test_query_loads_only_the_datasets_it_needs(self, dao):
+        dao.get_top_batting_leaders(1965, "NL", "HR")
+        assert set(dao.frame_sizes()) == {"batting_df", "people_df"}
+
+    def test_warmup_skips_unqueried_datasets(self, dao):
+        dao.start_warmup().join()
+        assert "teams_df" not in dao.frame_sizes()
+        assert "fielding_of_split_df" in dao.frame_sizes()
+
+    def test_concurrent_first_access_loads_once(self, dao):
+        with patch.object(BaseballCSVDAO, "_load_dataset", autospec=True, side_effect=BaseballCSVDAO._load_dataset) as load:
+            threads = [threading.Thread(target=dao.get_top_batting_leaders, args=(1965, "NL", "HR")) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        loaded = [call.args[1] for call in load.call_args_list]
+        assert sorted(loaded) == ["batting_df", "people_df"]
+
+
+class TestBaseballCSVDAOMaterialized:
+    def test_materialized_lookups_match_queries(self, csv_dir):
+        dao = BaseballCSVDAO(base_dir=csv_dir)
+        materialized = BaseballCSVDAO(base_dir=csv_dir, materialize=True)
+
+        assert materialized.get_top_batting_leaders(1965, "NL", "HR") == dao.get_top_batting_leaders(1965, "NL", "HR")
+        assert materialized.get_top_pitching_leaders(1965, "NL", "ERA") == dao.get_top_pitching_leaders(1965, "NL", "ERA")
+        assert sorted(materialized.get_award_vote_getters(1965, "NL", "Most Valuable Player"), key=str) == \
+            sorted(dao.get_award_vote_getters(1965, "NL", "Most Valuable Player"), key=str)
+        assert sorted(materialized.get_starters_for_position(1965, "NL", "SS"), key=str) == \
+            sorted(dao.get_starters_for_position(1965, "NL", "SS"), key=str)
+
+    def test_materialized_lookup_of_missing_season_is_empty(self, csv_dir):
+        dao = BaseballCSVDAO(base_dir=csv_dir, materialize=True)
+        assert dao.get_top_batting_leaders(1950, "AL", "HR") == []
+
+    def test_non_puzzle_requests_fall_back_to_query(self, csv_dir):
+        dao = BaseballCSVDAO(base_dir=csv_dir, materialize=True)
+        assert dao.get_top_batting_leaders(1965, "NL", "HR", top_n=1) == [{"name": "Willie Mays", "value": 52}]
+
+
+class TestBaseballCSVDAOLean:
+    def test_lean_load_projects_and_downcasts(self, csv_dir):
+        dao = BaseballCSVDAO(base_dir=csv_dir, lean=True)
+
+        assert set(dao.pitching_df.columns) == {"playerID", "yearID", "lgID", "IPouts", "W", "SO", "ERA", "SV"}
+        assert dao.pitching_df.schema["yearID"] == pl.Int16
+        assert dao.pitching_df.schema["ERA"] == pl.Float64
+        assert dao.fielding_df.schema["POS"] == pl.Categorical
+
+    def test_lean_queries_match_full_load(self, csv_dir):
+        dao = BaseballCSVDAO(base_dir=csv_dir)
+        lean = BaseballCSVDAO(base_dir=csv_dir, lean=True)
+
+        assert lean.get_top_batting_leaders(1965, "NL", "HR") == dao.get_top_batting_leaders(1965, "NL", "HR")
+        assert lean.get_top_pitching_leaders(1965, "NL", "ERA") == dao.get_top_pitching_leaders(1965, "NL", "ERA")
+        assert sorted(lean.get_starters_for_position(1965, "NL", "SS"), key=str) == \
+            sorted(dao.get_starters_for_position(1965, "NL", "SS"), key=str)
+        dao.warm_up()
+        lean.warm_up()
+        assert sum(lean.frame_sizes().values()) < sum(dao.frame_sizes().values())
+
+
+class TestBaseballCSVDAOSnapshot:
+    def test_first_load_writes_snapshot(self, csv_dir, tmp_path):
+        snapshot_dir = tmp_path / "snapshot"
+
+        BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir).get_top_batting_leaders(1965, "NL", "HR")
+
+        snapshots = sorted(p.name.split("-")[0] for p in snapshot_dir.iterdir() if not p.name.startswith("."))
+        assert snapshots == ["batting_df", "people_df"]
+
+    def test_snapshot_load_matches_csv_load(self, csv_dir, tmp_path):
+        snapshot_dir = tmp_path / "snapshot"
+
+        from_csv = BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir)
+        from_csv.warm_up()
+        with patch("src.dao.baseball_csv_dao.pl.read_csv", side_effect=AssertionError("CSV parsed")):
+            from_snapshot = BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir)
+            assert from_snapshot.get_top_batting_leaders(1965, "NL", "HR") == from_csv.get_top_batting_leaders(1965, "NL", "HR")
+            assert from_snapshot.get_top_pitching_leaders(1965, "NL", "ERA") == from_csv.get_top_pitching_leaders(1965, "NL", "ERA")
+
+    def test_changed_source_invalidates_snapshot(self, csv_dir, tmp_path):
+        snapshot_dir = tmp_path / "snapshot"
+        BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir).warm_up()
+
+        (csv_dir / "Batting.csv").write_text(CSV_FILES["Batting.csv"] + "ruthba01,1965,2,NYA,AL,60,90,120,1\n")
+        dao = BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir)
+
+        assert dao.get_top_batting_leaders(1965, "AL", "HR")[0]["value"] == 60
+        assert len([p for p in snapshot_dir.glob("batting_df-*")]) == 1
+
+    def test_new_snapshot_removes_superseded_ones(self, csv_dir, tmp_path):
+        snapshot_dir = tmp_path / "snapshot"
+        BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir).warm_up()
+        old_batting = next(snapshot_dir.glob("batting_df-*.arrow"))
+        old_pitching = next(snapshot_dir.glob("pitching_df-*.arrow"))
+
+        (csv_dir / "Batting.csv").write_text(CSV_FILES["Batting.csv"] + "ruthba01,1965,2,NYA,AL,60,90,120,1\n")
+        BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir).warm_up()
+
+        assert not old_batting.exists()
+        assert not (snapshot_dir / f".{old_batting.name}.lock").exists()
+        assert len(list(snapshot_dir.glob("batting_df-*.arrow"))) == 1
+        assert old_pitching.exists()
+
+    def test_other_configurations_keep_their_snapshots(self, csv_dir, tmp_path):
+        snapshot_dir = tmp_path / "snapshot"
+        BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir).warm_up()
+        BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir, lean=True).warm_up()
+
+        batting = sorted(p.name.endswith("-lean.arrow") for p in snapshot_dir.glob("batting_df-*.arrow"))
+        assert batting == [False, True]
+
+    def test_snapshot_removed_before_mapping_is_rebuilt(self, csv_dir, tmp_path):
+        snapshot_dir = tmp_path / "snapshot"
+        BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir).warm_up()
+        dao = BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir)
+        read_ipc = pl.read_ipc
+        calls = []
+
+        def read_once_missing(path, **kwargs):
+            calls.append(path)
+            if len(calls) == 1:
+                raise FileNotFoundError(path)
+            return read_ipc(path, **kwargs)
+
+        with patch("src.dao.baseball_csv_dao.pl.read_ipc", side_effect=read_once_missing):
+            df, source = dao._load_shared("people_df")
+
+        assert source == "snapshot"
+        assert len(df) == 4
+        assert len(calls) == 2
+
+    def test_concurrent_builders_parse_csv_once(self, csv_dir, tmp_path):
+        snapshot_dir = tmp_path / "snapshot"
+        daos = [BaseballCSVDAO(base_dir=csv_dir, snapshot_dir=snapshot_dir) for _ in range(4)]
+
+        with patch.object(BaseballCSVDAO, "_parse_csv", autospec=True, side_effect=BaseballCSVDAO._parse_csv) as parse:
+            threads = [threading.Thread(target=dao.get_top_batting_leaders, args=(1965, "NL", "HR")) for dao in daos]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert sorted(call.args[1] for call in parse.call_args_list) == ["batting_df", "people_df"]
+        assert all(dao.get_top_batting_leaders(1965, "NL", "HR")[0]["name"] == "Willie Mays" for dao in daos)
+
+
+class TestBaseballCSVDAOFeasibility:
+    def test_index_only_contains_full_size_configs(self, dao):
+        index = dao.get_feasible_configs()
+
+        # Leaderboards have fewer than PUZZLE_TOP_N players in the fixture
+        assert index["batting_stat"] == ()
+        assert index["pitching_stat"] == ()
+        # The Cy Young has a single vote getter, below AWARD_MIN_VOTE_GETTERS
+        assert index["award_votes"] == ((1965, "NL", "Most Valuable Player"),)
+        # SS has a starter for both fielding teams; CF only covers one of them
+        assert index["starters"] == ((1965, "NL", "SS"),)
+
+    def test_leaderboards_need_enough_qualifiers(self, dao):
+        with patch("src.dao.baseball_csv_dao.PUZZLE_TOP_N", 2):
+            index = dao.get_feasible_configs()
+
+        assert (1965, "NL", "HR") in index["batting_stat"]
+        assert (1966, "NL", "HR") not in index["batting_stat"]
+        assert (1965, "NL", "W") in index["pitching_stat"]
+        assert (1965, "NL", "ERA") in index["pitching_stat"]
+
+    def test_awards_need_enough_vote_getters(self, dao):
+        with patch("src.dao.baseball_csv_dao.AWARD_MIN_VOTE_GETTERS", 1):
+            assert (1965, "ML", "Cy Young Award") in dao._build_feasibility_index()["award_votes"]
+        with patch("src.dao.baseball_csv_dao.AWARD_MIN_VOTE_GETTERS", 4):
+            assert dao._build_feasibility_index()["award_votes"] == ()
+
+    def test_index_is_built_once(self, dao):
+        assert dao.get_feasible_configs() is dao.get_feasible_configs()
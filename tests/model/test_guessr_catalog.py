@@ -0,0 +1,48 @@
+from datetime import date
+import gzip
+import pytest
+
+from src.model.guessr_catalog import GuessrCatalog, PlannedPuzzle
+
+
+def make_catalog() -> GuessrCatalog:
+    return GuessrCatalog(dataset_version="2024.1", days={
+        date(2025, 1, 15): [
+            PlannedPuzzle(
+                puzzle_number=n,
+                puzzle_type="batting_stat",
+                answer=1998 + n,
+                config={"league": "NL", "stat": "HR"},
+                players=[{"name": "Mark McGwire", "stat_value": 70}]
+            )
+            for n in range(3)
+        ],
+    })
+
+
+class TestGuessrCatalog:
+    def test_round_trips_through_a_file(self, tmp_path):
+        path = tmp_path / "catalog.json.gz"
+        make_catalog().write(path)
+
+        assert GuessrCatalog.load(path) == make_catalog()
+
+    def test_identical_schedules_write_identical_bytes(self, tmp_path):
+        make_catalog().write(tmp_path / "a.json.gz")
+        make_catalog().write(tmp_path / "b.json.gz")
+
+        assert (tmp_path / "a.json.gz").read_bytes() == (tmp_path / "b.json.gz").read_bytes()
+
+    def test_rejects_other_format_versions(self, tmp_path):
+        path = tmp_path / "catalog.json.gz"
+        path.write_bytes(gzip.compress(make_catalog().model_copy(update={"format_version": 99}).model_dump_json().encode()))
+
+        with pytest.raises(ValueError, match="catalog format 99"):
+            GuessrCatalog.load(path)
+
+    def test_only_applies_to_its_dataset_version(self):
+        catalog = make_catalog()
+
+        assert len(catalog.puzzles_for(date(2025, 1, 15), "2024.1")) == 3
+        assert catalog.puzzles_for(date(2025, 1, 15), "2025.1") is None
+        assert catalog.puzzles_for(date(2025, 1, 16), "2024.1") is None
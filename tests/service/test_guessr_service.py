@@ -1,17 +1,25 @@
 from unittest.mock import MagicMock
-from datetime import date, datetime, UTC
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, UTC
+import threading
+import time
 import pytest
 
-from src.service.guessr_service import GuessrService
+from src.service.guessr_service import GuessrService, PUZZLE_TIMEZONE, create_guessr_cache
 from src.dao.guessr_dao import GuessrDAO
 from src.dao.baseball_csv_dao import BaseballCSVDAO
 from src.model.api.guess_item import GuessItem
 from src.model.db.guessr_orm import GuessrORM, GuessrPuzzleORM
+from src.model.guessr_catalog import GuessrCatalog
 from src.model.view.batch_guess_validation_view import BatchGuessValidationView
+from src.model.view.guessr_list_view import GuessrListView
+from src.util.single_flight import SingleFlight
+from src.util.tiered_cache import InMemoryCacheBackend
 
 
 class TestGuessrServiceScoring:
     def setup_method(self):
+        GuessrService._answer_keys.clear()
         self.mock_guessr_dao = MagicMock(spec=GuessrDAO)
         self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
         self.service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao)
@@ -85,6 +93,23 @@ class TestGuessrServiceScoring:
         assert result.results[2].score == 33
         assert result.overall_score == 100
 
+    def test_validate_guesses_rejects_future_guessrs(self):
+        tomorrow = datetime.now(PUZZLE_TIMEZONE).date() + timedelta(days=1)
+        self.mock_guessr_dao.get_guessr_by_id.return_value = GuessrORM(id=43, date=tomorrow, created_at=datetime.now(UTC))
+        self.mock_guessr_dao.get_puzzles_by_guessr_id.return_value = [
+            GuessrPuzzleORM(puzzle_number=n, puzzle_type="batting_stat", answer=2000, config={}) for n in range(3)
+        ]
+
+        with pytest.raises(ValueError, match="Guessr 43 not found"):
+            self.service.validate_guesses(guessr_id=43, guesses=[GuessItem(id=0, year=2000)])
+
+    def test_summary_excludes_future_guessrs(self):
+        self.mock_guessr_dao.get_all_guessrs.return_value = []
+
+        self.service.get_all_guessrs()
+
+        self.mock_guessr_dao.get_all_guessrs.assert_called_once_with(end_date=datetime.now(PUZZLE_TIMEZONE).date())
+
     def test_validate_guesses_mixed_accuracy(self):
         puzzle_date = date(2025, 1, 15)
 
@@ -189,6 +214,22 @@ class TestGuessrServiceScoring:
         with pytest.raises(ValueError, match="Guessr 999 not found"):
             self.service.validate_guesses(guessr_id=999, guesses=guesses)
 
+    def test_validate_guesses_warm_answer_key_skips_database(self):
+        self.mock_guessr_dao.get_guessr_by_id.return_value = GuessrORM(id=42, date=date(2025, 1, 15), created_at=datetime.now(UTC))
+        self.mock_guessr_dao.get_puzzles_by_guessr_id.return_value = [
+            GuessrPuzzleORM(id=n, guessr_id=42, puzzle_number=n, puzzle_type="batting_stat", answer=2000 + n, config={}, created_at=datetime.now(UTC))
+            for n in range(3)
+        ]
+        guesses = [GuessItem(id=0, year=2000), GuessItem(id=2, year=2001)]
+
+        cold = self.service.validate_guesses(guessr_id=42, guesses=guesses)
+        self.mock_guessr_dao.reset_mock()
+        warm = self.service.validate_guesses(guessr_id=42, guesses=guesses)
+
+        assert warm == cold
+        assert [result.correct_answer for result in warm.results] == [2000, 2002]
+        assert self.mock_guessr_dao.mock_calls == []
+
     def test_validate_guesses_incomplete_puzzles(self):
         puzzle_date = date(2025, 1, 15)
 
@@ -208,3 +249,550 @@ class TestGuessrServiceScoring:
 
         with pytest.raises(ValueError, match="Expected 3 puzzles for guessr 42, found 2"):
             self.service.validate_guesses(guessr_id=42, guesses=guesses)
+
+
+class TestGuessrServiceTransform:
+    def setup_method(self):
+        self.mock_guessr_dao = MagicMock(spec=GuessrDAO)
+        self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
+        self.service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao)
+
+    def test_transform_to_views_fetches_players_in_one_batch(self):
+        puzzles = [
+            GuessrPuzzleORM(id=1, guessr_id=42, puzzle_number=0, puzzle_type="batting_stat", answer=2000, config={"league": "AL", "stat": "HR"}, created_at=datetime.now(UTC)),
+            GuessrPuzzleORM(id=2, guessr_id=42, puzzle_number=1, puzzle_type="award_votes", answer=1960, config={"league": "ML", "award": "Cy Young Award"}, created_at=datetime.now(UTC)),
+            GuessrPuzzleORM(id=3, guessr_id=42, puzzle_number=2, puzzle_type="starters", answer=2010, config={"league": "NL", "position": "SS"}, created_at=datetime.now(UTC))
+        ]
+        self.mock_baseball_dao.get_players_for_configs.return_value = [
+            [{"name": "Troy Glaus", "value": 47}],
+            [{"name": "Vern Law"}],
+            [{"name": "Troy Tulowitzki", "platoon": False}],
+        ]
+
+        views = self.service._transform_to_views(puzzles)
+
+        self.mock_baseball_dao.get_players_for_configs.assert_called_once_with([
+            ("batting_stat", 2000, "AL", "HR"),
+            ("award_votes", 1960, "ML", "Cy Young Award"),
+            ("starters", 2010, "NL", "SS"),
+        ])
+        assert [view.id for view in views] == [0, 1, 2]
+        assert views[2].players == [{"name": "Troy Tulowitzki", "platoon": False}]
+
+    def test_transform_to_views_uses_stored_players(self):
+        puzzles = [
+            GuessrPuzzleORM(puzzle_number=0, puzzle_type="batting_stat", answer=2000, config={"league": "AL", "stat": "HR"}, players=[{"name": "Troy Glaus", "value": 47}]),
+            GuessrPuzzleORM(puzzle_number=1, puzzle_type="award_votes", answer=1960, config={"league": "ML", "award": "Cy Young Award"}, players=[{"name": "Vern Law"}]),
+        ]
+
+        views = self.service._transform_to_views(puzzles)
+
+        self.mock_baseball_dao.get_players_for_configs.assert_not_called()
+        assert [view.players for view in views] == [[{"name": "Troy Glaus", "value": 47}], [{"name": "Vern Law"}]]
+
+    def test_transform_to_views_fetches_only_rows_without_players(self):
+        puzzles = [
+            GuessrPuzzleORM(puzzle_number=0, puzzle_type="batting_stat", answer=2000, config={"league": "AL", "stat": "HR"}, players=[{"name": "Troy Glaus", "value": 47}]),
+            GuessrPuzzleORM(puzzle_number=1, puzzle_type="award_votes", answer=1960, config={"league": "ML", "award": "Cy Young Award"}),
+        ]
+        self.mock_baseball_dao.get_players_for_configs.return_value = [[{"name": "Vern Law"}]]
+
+        views = self.service._transform_to_views(puzzles)
+
+        self.mock_baseball_dao.get_players_for_configs.assert_called_once_with([("award_votes", 1960, "ML", "Cy Young Award")])
+        assert views[1].players == [{"name": "Vern Law"}]
+
+
+class TestGuessrServiceGeneration:
+    FEASIBLE_CONFIGS = {
+        "batting_stat": ((1998, "NL", "HR"), (2001, "NL", "HR"), (1961, "AL", "HR")),
+        "pitching_stat": ((1985, "NL", "ERA"), (1968, "NL", "ERA")),
+        "award_votes": ((1956, "ML", "Cy Young Award"), (1980, "AL", "Rookie of the Year")),
+        "starters": ((2010, "AL", "SS"),),
+    }
+
+    def setup_method(self):
+        GuessrService._used_configs.clear()
+        self.mock_guessr_dao = MagicMock(spec=GuessrDAO)
+        self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
+        self.service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao)
+
+        self.mock_guessr_dao.create_guessr.return_value = GuessrORM(id=7, date=date(2025, 1, 15), created_at=datetime.now(UTC))
+        self.mock_guessr_dao.get_guessr_by_date.return_value = None
+        self.mock_guessr_dao.get_puzzle_configs_in_date_range.return_value = []
+        self.mock_guessr_dao.create_puzzles.side_effect = lambda puzzles: puzzles
+        self.mock_baseball_dao.get_feasible_configs.return_value = self.FEASIBLE_CONFIGS
+        self.mock_baseball_dao.get_players_for_configs.side_effect = lambda configs: [[{"name": "Player"}] for _ in configs]
+
+    def test_generation_samples_from_feasible_configs(self):
+        _, views = self.service._generate_and_store_guessr(date(2025, 1, 15))
+
+        assert len(views) == 3
+        for view in views:
+            key = self.service.CONFIG_KEYS[view.puzzle_type]
+            stored = self.mock_guessr_dao.create_puzzles.call_args.args[0][view.id]
+            assert (stored.answer, view.hints["league"], view.hints[key]) in self.FEASIBLE_CONFIGS[view.puzzle_type]
+
+    def test_generation_stores_player_lists(self):
+        _, views = self.service._generate_and_store_guessr(date(2025, 1, 15))
+
+        stored = self.mock_guessr_dao.create_puzzles.call_args.args[0]
+        assert [puzzle.players for puzzle in stored] == [view.players for view in views]
+
+    def test_consecutive_days_query_used_configs_once(self):
+        self.service._generate_and_store_guessr(date(2025, 1, 15))
+        self.service._generate_and_store_guessr(date(2025, 1, 16))
+
+        self.mock_guessr_dao.get_puzzle_configs_in_date_range.assert_called_once_with(date(2024, 1, 16), date(2025, 1, 14))
+
+    def test_second_day_excludes_configs_generated_the_day_before(self):
+        self.service._generate_and_store_guessr(date(2025, 1, 15))
+        self.service._generate_and_store_guessr(date(2025, 1, 16))
+
+        first, second = [
+            {GuessrService._dao_config(p.puzzle_type, p.answer, p.config) for p in call.args[0]}
+            for call in self.mock_guessr_dao.create_puzzles.call_args_list
+        ]
+        assert len(first) == len(second) == 3
+        assert not first & second
+
+    def test_generation_is_deterministic_per_date(self):
+        _, first = self.service._generate_and_store_guessr(date(2025, 1, 15))
+        _, second = self.service._generate_and_store_guessr(date(2025, 1, 15))
+
+        assert first == second
+
+    def test_generation_skips_configs_used_in_the_past_year(self):
+        self.mock_guessr_dao.get_puzzle_configs_in_date_range.return_value = [
+            (date(2024, 6, 1), "batting_stat", 1998, {"league": "NL", "stat": "HR"}),
+            (date(2024, 9, 1), "starters", 2010, {"league": "AL", "position": "SS"}),
+        ]
+
+        _, views = self.service._generate_and_store_guessr(date(2025, 1, 15))
+
+        stored = self.mock_guessr_dao.create_puzzles.call_args.args[0]
+        chosen = {(puzzle.puzzle_type, puzzle.answer) for puzzle in stored}
+        assert len(chosen) == 3
+        assert ("batting_stat", 1998) not in chosen
+        assert ("starters", 2010) not in chosen
+
+    def test_generation_fails_when_every_config_is_used(self):
+        used_configs = {
+            (puzzle_type, *config)
+            for puzzle_type, configs in self.FEASIBLE_CONFIGS.items()
+            for config in configs
+        }
+
+        with pytest.raises(RuntimeError, match="No unused puzzle configurations"):
+            self.service._select_puzzle_configs(date(2025, 1, 15), used_configs)
+
+
+class TestGuessrServiceCache:
+    def setup_method(self):
+        GuessrService._cache.clear()
+        GuessrService._used_configs.clear()
+        GuessrService._response_cache.clear()
+        self.mock_guessr_dao = MagicMock(spec=GuessrDAO)
+        self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
+        self.mock_baseball_dao.dataset_version = "2024.1"
+        self.service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao)
+
+        self.mock_guessr_dao.get_guessr_by_date.return_value = GuessrORM(id=42, date=date(2025, 1, 15), created_at=datetime.now(UTC))
+        self.mock_guessr_dao.get_puzzles_by_guessr_id.return_value = [
+            GuessrPuzzleORM(puzzle_number=n, puzzle_type="batting_stat", answer=2000 + n, config={"league": "AL", "stat": "HR"})
+            for n in range(3)
+        ]
+        self.mock_baseball_dao.get_players_for_configs.side_effect = lambda configs: [[{"name": "Player", "value": 40}] for _ in configs]
+
+    def test_warm_hit_issues_no_database_queries(self):
+        cold = self.service.get_puzzles_for_date(date(2025, 1, 15))
+        self.mock_guessr_dao.reset_mock()
+        self.mock_baseball_dao.reset_mock()
+
+        warm = self.service.get_puzzles_for_date(date(2025, 1, 15))
+
+        assert warm == cold
+        assert warm.id == 42
+        assert self.mock_guessr_dao.mock_calls == []
+        assert self.mock_baseball_dao.get_players_for_configs.call_count == 0
+
+    def test_serialized_puzzles_are_rendered_once(self):
+        first = self.service.get_serialized_puzzles(date(2025, 1, 15))
+        self.mock_guessr_dao.reset_mock()
+
+        second = self.service.get_serialized_puzzles(date(2025, 1, 15))
+
+        assert second is first
+        assert GuessrListView.model_validate_json(first.body) == self.service.get_puzzles_for_date(date(2025, 1, 15))
+        assert first.etag.startswith('"') and first.etag.endswith('"')
+        assert self.mock_guessr_dao.mock_calls == []
+
+    def test_shared_cache_serves_other_instances(self):
+        shared = InMemoryCacheBackend()
+        first = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao, cache=create_guessr_cache(shared))
+        cold = first.get_puzzles_for_date(date(2025, 1, 15))
+        self.mock_guessr_dao.reset_mock()
+
+        second = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao, cache=create_guessr_cache(shared))
+        warm = second.get_puzzles_for_date(date(2025, 1, 15))
+
+        assert warm == cold
+        assert self.mock_guessr_dao.mock_calls == []
+
+    def test_shared_cache_outage_falls_back_to_database(self):
+        broken = MagicMock(spec=InMemoryCacheBackend)
+        broken.get.side_effect = ConnectionError("connection refused")
+        broken.set.side_effect = ConnectionError("connection refused")
+        service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao, cache=create_guessr_cache(broken))
+
+        result = service.get_puzzles_for_date(date(2025, 1, 15))
+
+        assert result.id == 42
+        assert service.get_puzzles_for_date(date(2025, 1, 15)) == result
+
+    def test_dataset_version_change_misses_cache(self):
+        self.service.get_puzzles_for_date(date(2025, 1, 15))
+        self.mock_baseball_dao.dataset_version = "2025.1"
+
+        self.service.get_puzzles_for_date(date(2025, 1, 15))
+
+        assert self.mock_guessr_dao.get_guessr_by_date.call_count == 2
+
+
+class TestGuessrServiceSingleFlight:
+    def setup_method(self):
+        GuessrService._cache.clear()
+        GuessrService._used_configs.clear()
+        GuessrService._response_cache.clear()
+        GuessrService._flights = SingleFlight("guessr-test")
+        self.mock_guessr_dao = MagicMock(spec=GuessrDAO)
+        self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
+        self.mock_baseball_dao.dataset_version = "2024.1"
+
+        self.mock_guessr_dao.get_guessr_by_date.return_value = None
+        self.mock_guessr_dao.get_puzzle_configs_in_date_range.return_value = []
+        self.mock_guessr_dao.create_puzzles.side_effect = lambda puzzles: puzzles
+        self.mock_baseball_dao.get_feasible_configs.return_value = TestGuessrServiceGeneration.FEASIBLE_CONFIGS
+        self.mock_baseball_dao.get_players_for_configs.side_effect = lambda configs: [[{"name": "Player"}] for _ in configs]
+
+    def teardown_method(self):
+        GuessrService._flights = SingleFlight("guessr")
+
+    def test_concurrent_requests_share_one_generation(self):
+        callers = 300
+        barrier = threading.Barrier(callers)
+
+        def create_guessr(puzzle_date, created_at):
+            # Hold the flight open until every caller has joined it
+            deadline = time.monotonic() + 5
+            flight = GuessrService._flights._flights["guessr:2024.1:2025-01-15"]
+            while flight.waiters < callers - 1 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            return GuessrORM(id=7, date=puzzle_date, created_at=created_at)
+
+        self.mock_guessr_dao.create_guessr.side_effect = create_guessr
+
+        def request():
+            barrier.wait()
+            return GuessrService(self.mock_guessr_dao, self.mock_baseball_dao).get_puzzles_for_date(date(2025, 1, 15))
+
+        with ThreadPoolExecutor(max_workers=callers) as executor:
+            results = list(executor.map(lambda _: request(), range(callers)))
+
+        assert self.mock_guessr_dao.create_guessr.call_count == 1
+        assert self.mock_baseball_dao.get_players_for_configs.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert GuessrService._flights.stats() == {"flights": 1, "waiters": callers - 1, "max_waiters": callers - 1}
+
+    def test_waiters_receive_the_leaders_error(self):
+        flight = SingleFlight("test")
+        started, release = threading.Event(), threading.Event()
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("generation failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, "2025-01-15", fail)
+            started.wait(5)
+            waiter = executor.submit(flight.do, "2025-01-15", lambda: "unused")
+            while flight._flights["2025-01-15"].waiters < 1:
+                time.sleep(0.001)
+            release.set()
+
+            for future in (leader, waiter):
+                with pytest.raises(RuntimeError, match="generation failed"):
+                    future.result()
+
+        assert flight.stats()["waiters"] == 1
+
+
+class TestGuessrServiceGenerationLock:
+    def setup_method(self):
+        GuessrService._cache.clear()
+        GuessrService._used_configs.clear()
+        GuessrService._response_cache.clear()
+        self.mock_guessr_dao = MagicMock(spec=GuessrDAO)
+        self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
+        self.mock_baseball_dao.dataset_version = "2024.1"
+        self.service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao)
+
+        self.winner = GuessrORM(id=42, date=date(2025, 1, 15), created_at=datetime.now(UTC))
+        self.winner_puzzles = [
+            GuessrPuzzleORM(puzzle_number=n, puzzle_type="batting_stat", answer=2000 + n, config={"league": "AL", "stat": "HR"})
+            for n in range(3)
+        ]
+        self.mock_guessr_dao.get_puzzle_configs_in_date_range.return_value = []
+        self.mock_guessr_dao.create_puzzles.side_effect = lambda puzzles: puzzles
+        self.mock_baseball_dao.get_feasible_configs.return_value = TestGuessrServiceGeneration.FEASIBLE_CONFIGS
+        self.mock_baseball_dao.get_players_for_configs.side_effect = lambda configs: [[{"name": "Player"}] for _ in configs]
+
+    def test_generation_runs_under_the_date_lock(self):
+        self.mock_guessr_dao.get_guessr_by_date.return_value = None
+        self.mock_guessr_dao.create_guessr.return_value = self.winner
+
+        result = self.service.get_puzzles_for_date(date(2025, 1, 15))
+
+        self.mock_guessr_dao.generation_lock.assert_called_once_with(date(2025, 1, 15))
+        assert result.id == 42
+        self.mock_guessr_dao.create_puzzles.assert_called_once()
+        assert len(self.mock_guessr_dao.create_puzzles.call_args.args[0]) == 3
+
+    def test_loser_returns_the_winners_puzzles(self):
+        # Not generated on the first read; committed by another instance once the lock is acquired
+        self.mock_guessr_dao.get_guessr_by_date.side_effect = [None, self.winner]
+        self.mock_guessr_dao.get_puzzles_by_guessr_id.return_value = self.winner_puzzles
+
+        result = self.service.get_puzzles_for_date(date(2025, 1, 15))
+
+        assert result.id == 42
+        assert [puzzle.id for puzzle in result.puzzles] == [0, 1, 2]
+        self.mock_guessr_dao.create_guessr.assert_not_called()
+        self.mock_baseball_dao.get_feasible_configs.assert_not_called()
+
+    def test_incomplete_guessr_is_regenerated_in_place(self):
+        self.mock_guessr_dao.get_guessr_by_date.return_value = self.winner
+        self.mock_guessr_dao.get_puzzles_by_guessr_id.return_value = self.winner_puzzles[:1]
+
+        result = self.service.get_puzzles_for_date(date(2025, 1, 15))
+
+        self.mock_guessr_dao.delete_puzzles.assert_called_once_with(42)
+        self.mock_guessr_dao.create_guessr.assert_not_called()
+        assert result.id == 42
+        assert len(result.puzzles) == 3
+
+
+class TestGuessrServiceBackfill:
+    FEASIBLE_CONFIGS = {
+        "batting_stat": tuple((year, "NL", "HR") for year in range(1950, 2000)),
+        "pitching_stat": tuple((year, "AL", "ERA") for year in range(1950, 2000)),
+    }
+
+    def setup_method(self):
+        GuessrService._used_configs.clear()
+        self.mock_guessr_dao = MagicMock(spec=GuessrDAO)
+        self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
+        self.service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao)
+
+        self.mock_guessr_dao.get_guessr_dates_in_range.return_value = set()
+        self.mock_guessr_dao.get_puzzle_configs_in_date_range.return_value = []
+        self.mock_guessr_dao.create_guessrs.side_effect = lambda dates, created_at: {d: d.toordinal() for d in dates}
+        self.mock_guessr_dao.create_puzzles.side_effect = lambda puzzles: puzzles
+        self.mock_baseball_dao.get_feasible_configs.return_value = self.FEASIBLE_CONFIGS
+        self.mock_baseball_dao.get_players_for_configs.side_effect = lambda configs: [[{"name": str(c)}] for c in configs]
+
+    def stored_puzzles(self) -> list[GuessrPuzzleORM]:
+        return [puzzle for call in self.mock_guessr_dao.create_puzzles.call_args_list for puzzle in call.args[0]]
+
+    def test_writes_missing_dates_in_batches(self):
+        self.mock_guessr_dao.get_guessr_dates_in_range.return_value = {date(2025, 1, 2)}
+
+        written = self.service.backfill_guessrs(date(2025, 1, 1), date(2025, 1, 5), batch_days=2)
+
+        assert written == [date(2025, 1, 1), date(2025, 1, 3), date(2025, 1, 4), date(2025, 1, 5)]
+        assert [call.args for call in self.mock_guessr_dao.generation_lock.call_args_list] == [
+            (date(2025, 1, 1), date(2025, 1, 3)),
+            (date(2025, 1, 4), date(2025, 1, 5)),
+        ]
+        assert self.mock_guessr_dao.create_puzzles.call_count == 2
+        assert len(self.stored_puzzles()) == 12
+
+    def test_player_lists_are_fetched_once_and_stored_with_their_puzzle(self):
+        self.service.backfill_guessrs(date(2025, 1, 1), date(2025, 1, 10))
+
+        self.mock_baseball_dao.get_players_for_configs.assert_called_once()
+        for puzzle in self.stored_puzzles():
+            assert puzzle.players == [{"name": str(GuessrService._dao_config(puzzle.puzzle_type, puzzle.answer, puzzle.config))}]
+
+    def test_no_config_repeats_within_the_range(self):
+        self.service.backfill_guessrs(date(2025, 1, 1), date(2025, 1, 30))
+
+        configs = [GuessrService._dao_config(p.puzzle_type, p.answer, p.config) for p in self.stored_puzzles()]
+        assert len(configs) == 90
+        assert len(set(configs)) == 90
+
+    def test_matches_on_demand_generation(self):
+        self.service.backfill_guessrs(date(2025, 1, 15), date(2025, 1, 15))
+        backfilled = [(p.puzzle_type, p.answer, p.config) for p in self.stored_puzzles()]
+
+        GuessrService._used_configs.clear()
+        selections = self.service._select_puzzle_configs(date(2025, 1, 15), set())
+
+        assert backfilled == [(puzzle_type, answer, config) for _, puzzle_type, answer, config in selections]
+
+    def test_dates_generated_concurrently_are_skipped(self):
+        self.mock_guessr_dao.create_guessrs.side_effect = lambda dates, created_at: {date(2025, 1, 2): 2}
+
+        written = self.service.backfill_guessrs(date(2025, 1, 1), date(2025, 1, 3))
+
+        assert written == [date(2025, 1, 2)]
+        assert {puzzle.guessr_id for puzzle in self.stored_puzzles()} == {2}
+
+    def test_only_written_dates_are_recorded_as_used(self):
+        self.mock_guessr_dao.create_guessrs.side_effect = lambda dates, created_at: {date(2025, 1, 2): 2}
+
+        self.service.backfill_guessrs(date(2025, 1, 1), date(2025, 1, 3))
+
+        recorded = GuessrService._used_configs.configs_between(date(2025, 1, 1), date(2025, 1, 3))
+        assert recorded == {GuessrService._dao_config(p.puzzle_type, p.answer, p.config) for p in self.stored_puzzles()}
+
+    def test_planning_does_not_record_configs(self):
+        planned = self.service.plan_guessrs([date(2025, 1, 1), date(2025, 1, 2)])
+
+        assert GuessrService._used_configs.configs_between(date(2025, 1, 1), date(2025, 1, 2)) == set()
+        configs = [GuessrService._dao_config(p.puzzle_type, p.answer, p.config) for puzzles in planned.values() for p in puzzles]
+        assert len(set(configs)) == 6
+
+    def test_rejects_dates_after_today(self):
+        tomorrow = datetime.now(PUZZLE_TIMEZONE).date() + timedelta(days=1)
+
+        with pytest.raises(ValueError, match="after today"):
+            self.service.backfill_guessrs(date(2025, 1, 1), tomorrow)
+
+        self.mock_guessr_dao.create_guessrs.assert_not_called()
+
+    def test_uses_the_given_player_fetcher(self):
+        fetch_players = MagicMock(side_effect=lambda configs: [[] for _ in configs])
+
+        self.service.backfill_guessrs(date(2025, 1, 1), date(2025, 1, 3), fetch_players=fetch_players)
+
+        fetch_players.assert_called_once()
+        assert len(fetch_players.call_args.args[0]) == 9
+        self.mock_baseball_dao.get_players_for_configs.assert_not_called()
+
+
+class TestGuessrServiceCatalog:
+    def setup_method(self):
+        GuessrService._cache.clear()
+        GuessrService._used_configs.clear()
+        GuessrService._response_cache.clear()
+        self.mock_guessr_dao = MagicMock(spec=GuessrDAO)
+        self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
+        self.mock_baseball_dao.dataset_version = "2024.1"
+
+        self.mock_guessr_dao.get_guessr_by_date.return_value = None
+        self.mock_guessr_dao.create_guessr.return_value = GuessrORM(id=7, date=date(2025, 1, 15), created_at=datetime.now(UTC))
+        self.mock_guessr_dao.get_guessr_dates_in_range.return_value = set()
+        self.mock_guessr_dao.get_puzzle_configs_in_date_range.return_value = []
+        self.mock_guessr_dao.create_puzzles.side_effect = lambda puzzles: puzzles
+        self.mock_baseball_dao.get_feasible_configs.return_value = TestGuessrServiceGeneration.FEASIBLE_CONFIGS
+        self.mock_baseball_dao.get_players_for_configs.side_effect = lambda configs: [[{"name": str(c)}] for c in configs]
+
+        planner = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao)
+        self.catalog = GuessrCatalog(dataset_version="2024.1", days=planner.plan_guessrs([date(2025, 1, 15)]))
+        GuessrService._used_configs.clear()
+        self.mock_baseball_dao.reset_mock()
+
+    def test_catalog_dates_are_stored_without_generation(self):
+        service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao, self.catalog)
+
+        result = service.get_puzzles_for_date(date(2025, 1, 15))
+
+        assert result.id == 7
+        assert [puzzle.players for puzzle in result.puzzles] == [p.players for p in self.catalog.days[date(2025, 1, 15)]]
+        self.mock_guessr_dao.generation_lock.assert_called_once_with(date(2025, 1, 15))
+        self.mock_baseball_dao.get_feasible_configs.assert_not_called()
+        self.mock_baseball_dao.get_players_for_configs.assert_not_called()
+
+    def test_catalog_matches_on_demand_generation(self):
+        from_catalog = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao, self.catalog)\
+            .get_puzzles_for_date(date(2025, 1, 15))
+        GuessrService._cache.clear()
+        GuessrService._used_configs.clear()
+
+        generated = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao).get_puzzles_for_date(date(2025, 1, 15))
+
+        assert from_catalog == generated
+
+    def test_other_dataset_version_falls_back_to_generation(self):
+        self.mock_baseball_dao.dataset_version = "2025.1"
+        service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao, self.catalog)
+
+        service.get_puzzles_for_date(date(2025, 1, 15))
+
+        self.mock_baseball_dao.get_feasible_configs.assert_called()
+
+    def test_dates_outside_the_catalog_are_generated(self):
+        service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao, self.catalog)
+
+        service.get_puzzles_for_date(date(2025, 1, 16))
+
+        self.mock_baseball_dao.get_feasible_configs.assert_called()
+
+
+class TestGuessrServiceStoredGuessrs:
+    def setup_method(self):
+        self.mock_guessr_dao = MagicMock(spec=GuessrDAO)
+        self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
+        self.service = GuessrService(self.mock_guessr_dao, self.mock_baseball_dao)
+        self.mock_baseball_dao.get_players_for_configs.side_effect = lambda configs: [[{"name": "Fetched"}] for _ in configs]
+
+    @staticmethod
+    def rows(guessr_id: int, puzzle_date: date, count: int = 3, players: list | None = None) -> list:
+        return [
+            (guessr_id, puzzle_date, GuessrPuzzleORM(
+                puzzle_number=n, puzzle_type="batting_stat", answer=2000 + n,
+                config={"league": "AL", "stat": "HR"}, players=players
+            ))
+            for n in range(count)
+        ]
+
+    def test_reads_many_dates_in_one_query(self):
+        self.mock_guessr_dao.get_puzzles_with_dates_in_range.return_value = [
+            *self.rows(1, date(2025, 1, 1), players=[{"name": "Stored"}]),
+            *self.rows(3, date(2025, 1, 3), players=[{"name": "Stored"}]),
+        ]
+
+        views = self.service.get_stored_guessrs([date(2025, 1, 1), date(2025, 1, 3)])
+
+        self.mock_guessr_dao.get_puzzles_with_dates_in_range.assert_called_once_with(date(2025, 1, 1), date(2025, 1, 3))
+        assert [(view.id, view.date) for view in views] == [(1, "2025-01-01"), (3, "2025-01-03")]
+        assert all(len(view.puzzles) == 3 for view in views)
+        self.mock_baseball_dao.get_players_for_configs.assert_not_called()
+
+    def test_skips_incomplete_and_unrequested_dates(self):
+        self.mock_guessr_dao.get_puzzles_with_dates_in_range.return_value = [
+            *self.rows(1, date(2025, 1, 1), players=[]),
+            *self.rows(2, date(2025, 1, 2), players=[]),
+            *self.rows(3, date(2025, 1, 3), count=1, players=[]),
+        ]
+
+        views = self.service.get_stored_guessrs([date(2025, 1, 1), date(2025, 1, 3)])
+
+        assert [view.id for view in views] == [1]
+
+    def test_missing_players_are_fetched_in_one_call(self):
+        self.mock_guessr_dao.get_puzzles_with_dates_in_range.return_value = [
+            *self.rows(1, date(2025, 1, 1)),
+            *self.rows(2, date(2025, 1, 2)),
+        ]
+
+        views = self.service.get_stored_guessrs([date(2025, 1, 1), date(2025, 1, 2)])
+
+        self.mock_baseball_dao.get_players_for_configs.assert_called_once()
+        assert all(puzzle.players == [{"name": "Fetched"}] for view in views for puzzle in view.puzzles)
+
+    def test_no_dates_reads_nothing(self):
+        assert self.service.get_stored_guessrs([]) == []
+        self.mock_guessr_dao.get_puzzles_with_dates_in_range.assert_not_called()
@@ -0,0 +1,73 @@
+import json
+import threading
+from unittest.mock import patch
+import pytest
+
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+from src.model.baseball_manifest import get_active_manifest
+from src.util.baseball_dataset_manager import BaseballDatasetManager
+from tests.dao.test_baseball_csv_dao import CSV_FILES
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    for name, content in CSV_FILES.items():
+        (tmp_path / name).write_text(content)
+    return tmp_path
+
+
+def bump_manifest(csv_dir, version, max_year=2024):
+    (csv_dir / "manifest.json").write_text(json.dumps({"version": version, "min_year": 1947, "max_year": max_year}))
+
+
+class TestBaseballDatasetManager:
+    def test_reload_swaps_in_the_new_dataset(self, csv_dir):
+        manager = BaseballDatasetManager(lambda: BaseballCSVDAO(base_dir=csv_dir))
+        old_dao = manager.get_dao()
+        bump_manifest(csv_dir, "next", max_year=2025)
+
+        new_dao = manager.reload()
+
+        assert manager.get_dao() is new_dao is not old_dao
+        assert new_dao.dataset_version == "next"
+        assert get_active_manifest().max_year == 2025
+        assert old_dao.dataset_version == "test"
+
+    def test_reload_warms_before_swapping(self, csv_dir):
+        manager = BaseballDatasetManager(lambda: BaseballCSVDAO(base_dir=csv_dir))
+        old_dao = manager.get_dao()
+        seen_during_warmup = []
+
+        def warm_up(dao):
+            seen_during_warmup.append(manager.get_dao())
+
+        with patch.object(BaseballCSVDAO, "warm_up", warm_up):
+            manager.reload()
+
+        assert seen_during_warmup == [old_dao]
+
+    def test_background_reload_rejects_a_second_reload(self, csv_dir):
+        manager = BaseballDatasetManager(lambda: BaseballCSVDAO(base_dir=csv_dir))
+        release = threading.Event()
+
+        with patch.object(BaseballCSVDAO, "warm_up", lambda dao: release.wait(5)):
+            assert manager.reload_in_background() is True
+            assert manager.reload_in_background() is False
+            release.set()
+            with manager._reload_lock:
+                pass
+
+            # Wait for this reload too, so no thread is left running after the test
+            assert manager.reload_in_background() is True
+            with manager._reload_lock:
+                pass
+
+    def test_failed_reload_keeps_serving_the_old_dataset(self, csv_dir):
+        manager = BaseballDatasetManager(lambda: BaseballCSVDAO(base_dir=csv_dir))
+        old_dao = manager.get_dao()
+        (csv_dir / "People.csv").unlink()
+
+        with pytest.raises(Exception):
+            manager.reload()
+
+        assert manager.get_dao() is old_dao
@@ -0,0 +1,46 @@
+from datetime import date, datetime, timedelta, UTC
+from unittest.mock import MagicMock, patch
+
+from src.dao.baseball_csv_dao import BaseballCSVDAO
+from src.service.guessr_service import PUZZLE_TIMEZONE
+from src.util.database_manager import DatabaseManager
+from src.util.guessr_scheduler import GuessrScheduler
+
+
+class TestGuessrScheduler:
+    def setup_method(self):
+        self.mock_database_manager = MagicMock(spec=DatabaseManager)
+        self.mock_baseball_dao = MagicMock(spec=BaseballCSVDAO)
+        self.scheduler = GuessrScheduler(self.mock_database_manager, lambda: self.mock_baseball_dao, lead_time=timedelta(minutes=30))
+
+    def test_next_run_is_lead_time_before_midnight_eastern(self):
+        now = datetime(2025, 1, 15, 12, 0, tzinfo=PUZZLE_TIMEZONE)
+        assert self.scheduler.seconds_until_next_run(now) == timedelta(hours=11, minutes=30).total_seconds()
+
+    def test_next_run_rolls_to_following_night_inside_lead_window(self):
+        now = datetime(2025, 1, 15, 23, 45, tzinfo=PUZZLE_TIMEZONE)
+        assert self.scheduler.seconds_until_next_run(now) == timedelta(hours=23, minutes=45).total_seconds()
+
+    def test_next_run_accepts_utc_clock(self):
+        # 03:00 UTC on Jan 16 is still Jan 15 in New York
+        now = datetime(2025, 1, 16, 3, 0, tzinfo=UTC)
+        assert self.scheduler.seconds_until_next_run(now) == timedelta(hours=1, minutes=30).total_seconds()
+
+    def test_run_once_prepares_only_today_outside_the_lead_window(self):
+        # 03:00 UTC on Jan 16 is 22:00 on Jan 15 in New York, two hours before midnight
+        with patch("src.util.guessr_scheduler.GuessrService") as mock_service_class:
+            dates = self.scheduler.run_once(datetime(2025, 1, 16, 3, 0, tzinfo=UTC))
+
+        assert dates == [date(2025, 1, 15)]
+        service = mock_service_class.return_value
+        assert [call.args[0] for call in service.get_serialized_puzzles.call_args_list] == dates
+
+    def test_run_once_prepares_today_and_tomorrow_in_eastern_time(self):
+        # 04:40 UTC on Jan 16 is 23:40 on Jan 15 in New York, inside the 30 minute lead window
+        with patch("src.util.guessr_scheduler.GuessrService") as mock_service_class:
+            dates = self.scheduler.run_once(datetime(2025, 1, 16, 4, 40, tzinfo=UTC))
+
+        assert dates == [date(2025, 1, 15), date(2025, 1, 16)]
+        service = mock_service_class.return_value
+        assert [call.args[0] for call in service.get_serialized_puzzles.call_args_list] == dates
+        assert mock_service_class.call_args.args[1] is self.mock_baseball_dao
@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+import sqlite3
+
+from src.util.tiered_cache import CacheBackend, InMemoryCacheBackend, SqliteCacheBackend, TieredCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTieredCache:
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.l2 = InMemoryCacheBackend(clock=self.clock)
+
+    def make_cache(self, l2: CacheBackend | None = None, max_len: int = 3) -> TieredCache[str]:
+        return TieredCache(
+            max_len=max_len,
+            ttl_seconds=60,
+            encode=str.encode,
+            decode=bytes.decode,
+            l2=l2,
+            clock=self.clock,
+        )
+
+    def test_l1_only_round_trip(self):
+        cache = self.make_cache()
+        cache.set("a", "value")
+
+        assert cache.get("a") == "value"
+        assert cache.get("b") is None
+
+    def test_l1_evicts_least_recently_used(self):
+        cache = self.make_cache()
+        for key in "abc":
+            cache.set(key, key)
+        cache.get("a")
+
+        cache.set("d", "d")
+
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in "acd"] == ["a", "c", "d"]
+
+    def test_entries_expire_in_both_tiers(self):
+        cache = self.make_cache(self.l2)
+        cache.set("a", "value")
+
+        self.clock.now += 61
+
+        assert cache.get("a") is None
+        assert self.l2.get("a") is None
+
+    def test_writes_reach_l2_encoded(self):
+        cache = self.make_cache(self.l2)
+        cache.set("a", "value")
+
+        assert self.l2.get("a") == b"value"
+
+    def test_l2_hit_is_shared_and_fills_l1(self):
+        self.make_cache(self.l2).set("a", "value")
+        other = self.make_cache(MagicMock(wraps=self.l2))
+
+        assert other.get("a") == "value"
+        assert other.get("a") == "value"
+        other.l2.get.assert_called_once_with("a")
+
+    def test_l2_outage_degrades_to_l1(self):
+        broken = MagicMock(spec=InMemoryCacheBackend)
+        broken.get.side_effect = ConnectionError("connection refused")
+        broken.set.side_effect = ConnectionError("connection refused")
+        cache = self.make_cache(broken)
+
+        cache.set("a", "value")
+
+        assert cache.get("a") == "value"
+        assert cache.get("b") is None
+        broken.set.assert_called_once()
+        broken.get.assert_not_called()
+
+    def test_l2_is_retried_after_the_backoff(self):
+        flaky = MagicMock(wraps=self.l2)
+        flaky.get.side_effect = [ConnectionError("connection refused"), b"value"]
+        cache = self.make_cache(flaky)
+
+        assert cache.get("a") is None
+        assert cache.get("a") is None
+        self.clock.now += TieredCache.L2_RETRY_SECONDS
+
+        assert cache.get("a") == "value"
+        assert flaky.get.call_count == 2
+
+    def test_undecodable_l2_entry_is_a_miss(self):
+        self.l2.set("a", b"\xff\xfe", 60)
+        cache = self.make_cache(self.l2)
+
+        assert cache.get("a") is None
+        self.l2.set("b", b"value", 60)
+        assert cache.get("b") == "value"
+
+    def test_clear_empties_only_l1(self):
+        cache = self.make_cache(self.l2)
+        cache.set("a", "value")
+
+        cache.clear()
+
+        assert cache._get_local("a") is None
+        assert cache.get("a") == "value"
+
+
+class TestSqliteCacheBackend:
+    def test_round_trip(self, tmp_path):
+        backend = SqliteCacheBackend(tmp_path / "cache.sqlite3")
+        backend.set("guessr:2024.1:2025-01-15", b"\x00payload", 60)
+
+        assert backend.get("guessr:2024.1:2025-01-15") == b"\x00payload"
+        assert backend.get("guessr:2025.1:2025-01-15") is None
+
+    def test_entries_survive_reopening(self, tmp_path):
+        SqliteCacheBackend(tmp_path / "cache.sqlite3").set("a", b"value", 60)
+
+        assert SqliteCacheBackend(tmp_path / "cache.sqlite3").get("a") == b"value"
+
+    def test_expired_entries_are_misses_and_purged_on_open(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        backend = SqliteCacheBackend(path)
+        backend.set("a", b"value", -1)
+
+        assert backend.get("a") is None
+        SqliteCacheBackend(path)
+        assert sqlite3.connect(path).execute("SELECT COUNT(*) FROM cache_entry").fetchone() == (0,)
+
+    def test_threads_share_the_file(self, tmp_path):
+        backend = SqliteCacheBackend(tmp_path / "cache.sqlite3")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda n: backend.set(str(n), str(n).encode(), 60), range(20)))
+
+        assert [backend.get(str(n)) for n in range(20)] == [str(n).encode() for n in range(20)]
+
+    def test_warms_a_restarted_tiered_cache(self, tmp_path):
+        def make_cache() -> TieredCache[str]:
+            return TieredCache(
+                max_len=3, ttl_seconds=60, encode=str.encode, decode=bytes.decode,
+                l2=SqliteCacheBackend(tmp_path / "cache.sqlite3"),
+            )
+        make_cache().set("a", "value")
+
+        assert make_cache().get("a") == "value"
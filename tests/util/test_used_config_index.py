@@ -0,0 +1,47 @@
+from datetime import date, timedelta
+
+from src.util.used_config_index import UsedConfigIndex
+
+HR = ("batting_stat", 1998, "NL", "HR")
+SS = ("starters", 2010, "AL", "SS")
+MVP = ("award_votes", 1985, "AL", "Most Valuable Player")
+
+
+class TestUsedConfigIndex:
+    def test_empty_index_misses_the_whole_window(self):
+        index = UsedConfigIndex()
+        assert index.missing_range(date(2024, 1, 1), date(2024, 12, 31)) == (date(2024, 1, 1), date(2024, 12, 31))
+
+    def test_loaded_window_is_served_from_memory(self):
+        index = UsedConfigIndex()
+        index.load(date(2024, 1, 1), date(2024, 12, 31), [(date(2024, 3, 1), HR), (date(2024, 6, 1), SS)])
+
+        assert index.missing_range(date(2024, 1, 1), date(2024, 12, 31)) is None
+        assert index.configs_between(date(2024, 1, 1), date(2024, 12, 31)) == {HR, SS}
+        assert index.configs_between(date(2024, 4, 1), date(2024, 12, 31)) == {SS}
+
+    def test_advancing_window_only_misses_new_dates(self):
+        index = UsedConfigIndex()
+        index.load(date(2024, 1, 1), date(2024, 12, 31), [])
+
+        assert index.missing_range(date(2024, 1, 5), date(2025, 1, 4)) == (date(2025, 1, 1), date(2025, 1, 4))
+
+    def test_generated_day_extends_coverage(self):
+        index = UsedConfigIndex()
+        index.load(date(2024, 1, 1), date(2024, 12, 31), [])
+        index.add(date(2025, 1, 1), [MVP])
+
+        assert index.missing_range(date(2024, 1, 2), date(2025, 1, 1)) is None
+        assert index.configs_between(date(2024, 1, 2), date(2025, 1, 1)) == {MVP}
+
+    def test_window_before_coverage_is_reloaded(self):
+        index = UsedConfigIndex()
+        index.load(date(2024, 1, 1), date(2024, 12, 31), [])
+        assert index.missing_range(date(2023, 6, 1), date(2024, 5, 31)) == (date(2023, 6, 1), date(2024, 5, 31))
+
+    def test_dates_beyond_the_window_expire(self):
+        index = UsedConfigIndex(window_days=365)
+        index.load(date(2024, 1, 1), date(2024, 1, 1), [(date(2024, 1, 1), HR)])
+        index.add(date(2024, 1, 1) + timedelta(days=400), [SS])
+
+        assert index.configs_between(date(2023, 1, 1), date(2026, 1, 1)) == {SS}